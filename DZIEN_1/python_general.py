@@ -78,6 +78,9 @@ from collections import defaultdict,Counter
 from functools import reduce
 from itertools import groupby
 from operator import attrgetter
+import operator
+import numpy as np
+import pandas as pd
 
 print(os.getcwd())
 
@@ -107,9 +110,254 @@ class TrainingLog:
         #najszybszy bieg - szukamy minimalnego pace (min/km)
         return min(self.workouts,key=lambda w:w.duration_min/max(w.distance_km,0.01))
     
-    def filter(self,predicate:Callable[[Workout],bool]) -> 'TrainingLog':
-        return TrainingLog(filter(predicate,self.workouts))
+    def filter(self,predicate:Callable[[Workout],bool]) -> 'Query':
+        #leniwie: predykaty zbierane w Query, lista liczona dopiero przez operację końcową
+        return Query(self,(predicate,))
+
+# _____ KOLUMNOWO (NumPy) ________
+WORKOUT_FIELDS=("day","kind","distance_km","climb_m","duration_min")
+
+class ColumnarTrainingLog:
+    """
+    TrainingLog jako struktura tablic: jedna tablica NumPy na pole Workout zamiast listy obiektów.
+    kind jako kategoria (kody int), day jako datetime64[D]; agregacje wektorowo - dla milionów
+    treningów z eksportu zegarka. To samo API co TrainingLog (by_kind zwraca podzbiory-logi).
+    """
+    def __init__(self,day,kind,distance_km,climb_m,duration_min):
+        self.day=np.asarray(day,dtype="datetime64[D]")
+        self.kind=kind if isinstance(kind,pd.Categorical) else pd.Categorical(np.asarray(kind,dtype=object))
+        self.distance_km=np.asarray(distance_km,dtype=np.float64)
+        self.climb_m=np.asarray(climb_m)
+        self.duration_min=np.asarray(duration_min)
+
+    @classmethod
+    def from_workouts(cls,workouts:Iterable[Workout]) -> 'ColumnarTrainingLog':
+        ws=list(workouts)
+        return cls(*(np.array([getattr(w,f) for w in ws]) for f in WORKOUT_FIELDS))
+
+    @classmethod
+    def from_frame(cls,df:pd.DataFrame) -> 'ColumnarTrainingLog':
+        return cls(*(df[f].to_numpy() if f!="kind" else pd.Categorical(df[f]) for f in WORKOUT_FIELDS))
+
+    @classmethod
+    def from_csv(cls,path) -> 'ColumnarTrainingLog':
+        # kolumny jak pola Workout: day,kind,distance_km,climb_m,duration_min
+        return cls.from_frame(pd.read_csv(path,dtype={"kind":"category"},parse_dates=["day"]))
+
+    @classmethod
+    def from_parquet(cls,path) -> 'ColumnarTrainingLog':
+        return cls.from_frame(pd.read_parquet(path,columns=list(WORKOUT_FIELDS)))
+
+    def __len__(self) -> int:
+        return self.distance_km.size
+
+    #iteracja i indeksowanie jak po liście Workout (np. podzbiory z by_kind())
+    def __iter__(self):
+        return (self._workout(i) for i in range(len(self)))
+
+    def __getitem__(self,i):
+        if isinstance(i,slice):
+            return [self._workout(j) for j in range(*i.indices(len(self)))]
+        return self._workout(range(len(self))[i])
+
+    def _take(self,idx) -> 'ColumnarTrainingLog':
+        return ColumnarTrainingLog(self.day[idx],self.kind[idx],self.distance_km[idx],self.climb_m[idx],self.duration_min[idx])
+
+    def _workout(self,i:int) -> Workout:
+        return Workout(str(self.day[i]),self.kind[i],self.distance_km[i].item(),self.climb_m[i].item(),self.duration_min[i].item())
+
+    @property
+    def workouts(self) -> list[Workout]:
+        #materializacja obiektów - tylko do wyświetlania/zgodności, nie do obliczeń
+        return list(self)
+
+    def total_distance(self) -> float:
+        return float(self.distance_km.sum())
+
+    def by_kind(self)->dict[str,'ColumnarTrainingLog']:
+        #jedno sortowanie po kodach kategorii i podział na spójne zakresy
+        codes=self.kind.codes
+        order=np.argsort(codes,kind="stable")
+        bounds=np.cumsum(np.bincount(codes[codes>=0],minlength=len(self.kind.categories)))
+        order=order[np.count_nonzero(codes<0):]
+        return {k:self._take(order[lo:hi]) for k,lo,hi in zip(self.kind.categories,np.r_[0,bounds[:-1]],bounds) if hi>lo}
+
+    def fastest(self) -> Workout:
+        #najszybszy bieg - minimalny pace (min/km), argmin zwraca pierwszy jak min()
+        return self._workout(int(np.argmin(self.duration_min/np.maximum(self.distance_km,0.01))))
+
+    def filter(self,predicate) -> 'Query':
+        #predykat F.pole <op> wartość albo maska bool - wektorowo; funkcja Workout -> bool wiersz po wierszu
+        return Query(self,(predicate,))
    
+# _____ ZAPYTANIA LENIWE ________
+def _workout_at(log,i:int) -> Workout:
+    return log._workout(i) if isinstance(log,ColumnarTrainingLog) else log.workouts[i]
+
+def _log_len(log) -> int:
+    return len(log) if isinstance(log,ColumnarTrainingLog) else len(log.workouts)
+
+class Pred:
+    """
+    Predykat deklaratywny (pole, operator, wartość): działa na Workout i wektorowo na kolumnach.
+    cols=None - predykat tylko wierszowy (zwykła funkcja Workout -> bool opakowana w Pred).
+    """
+    def __init__(self,row,cols=None):
+        self.row=row    #Workout -> bool
+        self.cols=cols  #ColumnarTrainingLog -> maska bool
+
+    def __call__(self,w:Workout) -> bool:
+        return self.row(w)
+
+    def mask(self,log) -> np.ndarray:
+        if self.cols is None or not isinstance(log,ColumnarTrainingLog):
+            return np.fromiter((self.row(_workout_at(log,i)) for i in range(_log_len(log))),dtype=bool,count=_log_len(log))
+        return np.asarray(self.cols(log),dtype=bool)
+
+    def _combine(self,other,row,cols) -> 'Pred':
+        other=_as_pred(other)
+        vectorized=self.cols is not None and other.cols is not None
+        return Pred(lambda w:row(self.row,other.row,w),(lambda log:cols(self.mask(log),other.mask(log))) if vectorized else None)
+
+    def __and__(self,other) -> 'Pred':
+        return self._combine(other,lambda a,b,w:a(w) and b(w),operator.and_)
+
+    def __or__(self,other) -> 'Pred':
+        return self._combine(other,lambda a,b,w:a(w) or b(w),operator.or_)
+
+    def __rand__(self,other) -> 'Pred':
+        return _as_pred(other)&self
+
+    def __ror__(self,other) -> 'Pred':
+        return _as_pred(other)|self
+
+    def __invert__(self) -> 'Pred':
+        return Pred(lambda w:not self.row(w),(lambda log:~self.mask(log)) if self.cols is not None else None)
+
+def _as_pred(p) -> Pred:
+    return p if isinstance(p,Pred) else Pred(p)
+
+def _as_column_value(col,value):
+    #day w Workout to tekst "RRRR-MM-DD", w logu kolumnowym datetime64 - porównanie po konwersji
+    if isinstance(col,np.ndarray) and col.dtype.kind=="M":
+        return np.asarray(value,dtype=col.dtype)
+    return value
+
+_ORDERING_OPS=(operator.lt,operator.le,operator.gt,operator.ge)
+
+def _ordered_column(col):
+    #kind w logu kolumnowym to Categorical bez porządku - <, >... po tekście, jak na liście Workout
+    if isinstance(col,pd.Categorical) and not col.ordered:
+        return np.asarray(col,dtype=object)
+    return col
+
+class Field:
+    def __init__(self,name:str):
+        self.name=name
+
+    def _pred(self,op,value) -> Pred:
+        name=self.name
+        def cols(log):
+            col=getattr(log,name)
+            if op in _ORDERING_OPS:
+                col=_ordered_column(col)
+            return op(col,_as_column_value(col,value))
+        return Pred(lambda w:op(getattr(w,name),value),cols)
+
+    def __eq__(self,value): return self._pred(operator.eq,value)
+    def __ne__(self,value): return self._pred(operator.ne,value)
+    def __lt__(self,value): return self._pred(operator.lt,value)
+    def __le__(self,value): return self._pred(operator.le,value)
+    def __gt__(self,value): return self._pred(operator.gt,value)
+    def __ge__(self,value): return self._pred(operator.ge,value)
+
+    def isin(self,values) -> Pred:
+        name,values=self.name,frozenset(values)
+        def cols(log):
+            col=getattr(log,name)
+            return pd.Series(col).isin(_as_column_value(col,list(values))).to_numpy()
+        return Pred(lambda w:getattr(w,name) in values,cols)
+
+class _Fields:
+    def __getattr__(self,name:str) -> Field:
+        return Field(name)
+
+F=_Fields() #np. F.kind=="trail", F.distance_km>15
+
+class Query:
+    """
+    Leniwy filtr TrainingLog/ColumnarTrainingLog: .filter() tylko dokłada predykat, dane są
+    przeglądane raz - w operacji końcowej (total_distance, by_kind, fastest, workouts, iteracja).
+    Na logu kolumnowym predykaty Pred i maski łączone są w jedną maskę bool, a zwykłe funkcje
+    Workout -> bool sprawdzane tylko dla wierszy, które przeszły maskę.
+    """
+    def __init__(self,source,predicates=()):
+        self.source=source
+        self.predicates=tuple(predicates)
+
+    def filter(self,predicate) -> 'Query':
+        return Query(self.source,self.predicates+(predicate,))
+
+    def mask(self) -> np.ndarray:
+        #maska bool wierszy źródła (logu kolumnowego albo listowego)
+        log=self.source
+        columnar=isinstance(log,ColumnarTrainingLog)
+        m=np.ones(_log_len(log),dtype=bool)
+        row_preds=[]
+        for p in self.predicates:
+            if isinstance(p,Pred) and p.cols is not None and columnar:
+                m&=p.mask(log)
+            elif callable(p):
+                row_preds.append(p.row if isinstance(p,Pred) else p)
+            else:
+                m&=np.asarray(p,dtype=bool)
+        for p in row_preds:
+            idx=np.flatnonzero(m)
+            m[idx]=np.fromiter((p(_workout_at(log,i)) for i in idx),dtype=bool,count=idx.size)
+        return m
+
+    def __iter__(self):
+        if isinstance(self.source,ColumnarTrainingLog) or not all(map(callable,self.predicates)):
+            return (_workout_at(self.source,i) for i in np.flatnonzero(self.mask()))
+        #łańcuch wbudowanych filter(): jeden przebieg, bez list pośrednich
+        it=iter(self.source.workouts)
+        for p in self.predicates:
+            it=filter(p.row if isinstance(p,Pred) else p,it)
+        return it
+
+    @property
+    def workouts(self) -> list[Workout]:
+        return list(self)
+
+    def collect(self):
+        #materializacja jako log tego samego typu co źródło
+        if isinstance(self.source,ColumnarTrainingLog):
+            return self.source._take(self.mask())
+        return TrainingLog(self)
+
+    def total_distance(self) -> float:
+        if isinstance(self.source,ColumnarTrainingLog):
+            return float(self.source.distance_km[self.mask()].sum())
+        return sum(w.distance_km for w in self)
+
+    def by_kind(self) -> dict:
+        if isinstance(self.source,ColumnarTrainingLog):
+            return self.collect().by_kind()
+        buckets:dict[str,list[Workout]]=defaultdict(list)
+        for w in self:
+            buckets[w.kind].append(w)
+        return buckets
+
+    def fastest(self) -> Workout:
+        log=self.source
+        if isinstance(log,ColumnarTrainingLog):
+            pace=np.where(self.mask(),log.duration_min/np.maximum(log.distance_km,0.01),np.inf)
+            i=int(np.argmin(pace))
+            if not np.isfinite(pace[i]):
+                raise ValueError("fastest() na pustym wyniku filtra")
+            return log._workout(i)
+        return min(self,key=lambda w:w.duration_min/max(w.distance_km,0.01))
+
 # ____DANE____
 ws = [
     Workout("2025-02-10","trail",38,1200,270),
@@ -151,3 +399,15 @@ print(f"licznik typów: {kinds_counter}")
 print(f"najszybszy trening: {log.fastest()}")
 print(f"unikalne dni: {unique_days}")
 print(f"Tylko trail >15: {[w for w in log.filter(lambda w:w.kind=='trail' and w.distance_km>15).workouts]}")
+
+#__wersja kolumnowa - te same wyniki____
+clog = ColumnarTrainingLog.from_workouts(ws)
+print(f"[kolumnowo] łaczny dystans [km]: {round(clog.total_distance(),1)}")
+print(f"[kolumnowo] suma km wg.typów { {k:round(b.total_distance(),2) for k,b in clog.by_kind().items()} }")
+print(f"[kolumnowo] najszybszy trening: {clog.fastest()}")
+print(f"[kolumnowo] Tylko trail >15: {clog.filter((clog.kind=='trail')&(clog.distance_km>15)).workouts}")
+
+#__leniwe filtry - predykaty łączone, jeden przebieg po danych____
+trail_long = log.filter(F.kind=="trail").filter(F.distance_km>15)
+print(f"[leniwie] trail >15 km: {trail_long.total_distance()} km, najszybszy: {trail_long.fastest()}")
+print(f"[leniwie, kolumnowo] trail >15 km: {clog.filter(F.kind=='trail').filter(F.distance_km>15).total_distance()} km")
@@ -0,0 +1,168 @@
+"""
+Benchmark zadań z three_tasks_v1 (solve_sales, solve_times, solve_races) i generatorów
+z tasks_solution.py w skali 10^3..10^7 wierszy.
+
+Dla każdego rozmiaru: czas generowania CSV, czas pierwszego wczytania (dla times z konwersją
+CSV -> .npy), czas samego wczytania danych (I/O), czas całej funkcji solve_* (mediana
+z powtórzeń) i szczyt pamięci (tracemalloc, osobny przebieg).
+Wyniki trafiają do bench_results/<commit>.json, więc przebiegi z różnych commitów można
+porównać (--compare poprzedni.json wypisuje zmiany czasów).
+
+Uruchomienie:
+    python bench_tasks.py [rozmiar ...] [--repeat N] [--compare plik.json]
+    python bench_tasks.py 1000 100000 10000000
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+BASE = Path(__file__).resolve().parent
+sys.path.insert(0, str(BASE / "three_tasks_v1"))
+
+from tasks_solution import make_sales_csv, make_times_csv, make_races_csv, make_csv_chunked  # noqa: E402
+from tasks.sales_task import solve_sales, SALES_DTYPES  # noqa: E402
+from tasks.times_task import solve_times  # noqa: E402
+from tasks.races_task import solve_races  # noqa: E402
+from tasks.race_store import RACES_DTYPES  # noqa: E402
+from utils.binary_cache import load_column  # noqa: E402
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6]
+SEED = 42                    # ten sam seed co domyślnie w make_*_csv
+CHUNKED_ABOVE = 1_000_000    # większe zbiory generowane porcjami (stała pamięć)
+RESULTS_DIR = BASE / "bench_results"
+
+MAKERS = {"sales": make_sales_csv, "times": make_times_csv, "races": make_races_csv}
+
+# kind -> (samo wczytanie danych tak jak w solve_*, cała funkcja)
+TASKS = {
+    "sales": (
+        lambda csv, out: pd.read_csv(csv, dtype=SALES_DTYPES, parse_dates=["order_date"]),
+        lambda csv, out: solve_sales(csv),
+    ),
+    "times": (
+        lambda csv, out: load_column(csv, "time_min"),
+        lambda csv, out: solve_times(csv),
+    ),
+    "races": (
+        lambda csv, out: pd.read_csv(csv, dtype=RACES_DTYPES, parse_dates=["date"]),
+        lambda csv, out: solve_races(csv, out / "race_means.png"),
+    ),
+}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def generate(kind: str, n: int, out_dir: Path) -> tuple[Path, float]:
+    t0 = time.perf_counter()
+    if n <= CHUNKED_ABOVE:
+        path = MAKERS[kind](out_dir, n=n, seed=SEED)
+    else:
+        path, = make_csv_chunked(kind, out_dir, n, seed=SEED)
+    return path, time.perf_counter() - t0
+
+
+def measure(func, repeat: int) -> tuple[float, float]:
+    """(mediana czasu [s], szczyt pamięci [MiB]) - pamięć w osobnym przebiegu, tracemalloc spowalnia."""
+    func()   # rozgrzewka
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return float(np.median(samples)), peak
+
+
+def bench_size(n: int, repeat: int) -> dict:
+    out = {}
+    with tempfile.TemporaryDirectory(prefix=f"bench_{n}_") as tmp:
+        work = Path(tmp)
+        for kind, (read, solve) in TASKS.items():
+            csv, gen_s = generate(kind, n, work)
+            # pierwsze wczytanie osobno: dla times buduje .npy, kolejne tylko otwierają memmap
+            t0 = time.perf_counter()
+            read(csv, work)
+            first_s = time.perf_counter() - t0
+            read_s, read_peak = measure(lambda: read(csv, work), repeat)
+            solve_s, solve_peak = measure(lambda: solve(csv, work), repeat)
+            out[kind] = {
+                "generate_s": gen_s,
+                "csv_mib": csv.stat().st_size / 2**20,
+                "io_first_s": first_s,
+                "io_s": read_s,
+                "io_peak_mib": read_peak,
+                "solve_s": solve_s,
+                "compute_s": max(solve_s - read_s, 0.0),
+                "solve_peak_mib": solve_peak,
+            }
+            print(f"  {kind:<6}{n:>12,}  gen {gen_s:>7.2f} s  1. odczyt {first_s:>7.3f} s  "
+                  f"I/O {read_s:>7.3f} s  solve {solve_s:>7.3f} s  szczyt {solve_peak:>8.1f} MiB")
+    return out
+
+
+def compare(current: dict, previous: dict) -> None:
+    print(f"\nPorównanie z {previous['commit']} (solve_s, >1.0x = wolniej):")
+    for size, kinds in current["results"].items():
+        for kind, row in kinds.items():
+            old = previous["results"].get(size, {}).get(kind)
+            if old is None:
+                continue
+            ratio = row["solve_s"] / old["solve_s"] if old["solve_s"] else float("nan")
+            # poniżej kilku ms różnice to głównie szum pomiaru
+            flag = "  <- regresja" if ratio > 1.1 and row["solve_s"] - old["solve_s"] > 0.005 else ""
+            print(f"  {kind:<6}{int(size):>12,}  {old['solve_s']:>8.3f} -> {row['solve_s']:>8.3f} s  {ratio:>5.2f}x{flag}")
+
+
+def main(sizes: list[int], repeat: int = 3, previous: Path | None = None) -> Path:
+    # wczytane przed zapisem - poprzedni plik może mieć tę samą nazwę (ten sam commit)
+    baseline = json.loads(Path(previous).read_text(encoding="utf-8")) if previous is not None else None
+    report = {
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "repeat": repeat,
+        "results": {},
+    }
+    for n in sizes:
+        print(f"\n[{n:,} wierszy]")
+        # powtórzenia tylko tam, gdzie przebieg jest krótki
+        report["results"][str(n)] = bench_size(n, repeat if n <= CHUNKED_ABOVE else 1)
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    path = RESULTS_DIR / f"{report['commit']}.json"
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print("\nWyniki zapisano w:", path)
+    if baseline is not None:
+        compare(report, baseline)
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat, args.compare)
@@ -1,15 +1,346 @@
+from __future__ import annotations
 from pathlib import Path
 import sqlite3
+import numpy as np
 import pandas as pd
 
 DB_PATH = Path("shop.db")
 
-def init_db(db_path: Path):
-    conn = sqlite3.connect(db_path)
+# Indeksy pod zapytania demo: JOIN po customer_id (z amount w indeksie - bez sięgania do tabeli),
+# GROUP BY country oraz filtr/sortowanie po amount
+DEFAULT_INDEXES = {
+    "ix_orders_customer_amount": "orders(customer_id, amount)",
+    "ix_orders_amount": "orders(amount)",
+    "ix_customers_country": "customers(country, customer_id)",
+}
+
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",        # odczyty nie blokują zapisu
+    "synchronous": "NORMAL",      # w trybie WAL bezpieczne i dużo szybsze niż FULL
+    "cache_size": -65536,         # ujemne = KiB -> 64 MiB cache stron
+    "mmap_size": 268435456,       # 256 MiB odczytów przez mmap
+    "temp_store": "MEMORY",
+}
+# Wymagane przez triggery country_stats niezależnie od strojenia: bez tego wiersz usunięty przez
+# REPLACE INTO (konflikt klucza) nie uruchamia triggera AFTER DELETE i liczniki się rozjeżdżają
+REQUIRED_PRAGMAS = {"recursive_triggers": "ON"}
+
+COUNTRIES = ["PL", "US", "DE", "FR", "GB"]
+
+Q_JOIN_AGG = """
+    SELECT
+        c.country,
+        COUNT(o.order_id) AS n_orders,
+        ROUND(SUM(o.amount)) AS total_amount,
+        ROUND(AVG(o.amount)) AS avg_amount
+    FROM
+        customers AS c
+    LEFT JOIN orders o ON o.customer_id = c.customer_id
+    GROUP BY c.country
+    ORDER BY total_amount desc;
+    """
+
+Q_JOIN_AGG_RAW = """
+    SELECT c.country, COUNT(o.order_id) AS n_orders, COALESCE(SUM(o.amount), 0) AS total_amount
+    FROM customers AS c
+    LEFT JOIN orders o ON o.customer_id = c.customer_id
+    GROUP BY c.country
+    """
+
+# Zmaterializowane statystyki krajów: te same kolumny co Q_JOIN_AGG, ale czytane z country_stats
+Q_COUNTRY_STATS = """
+    SELECT
+        country,
+        n_orders,
+        ROUND(CASE WHEN n_orders > 0 THEN total_amount END) AS total_amount,
+        ROUND(total_amount / NULLIF(n_orders, 0)) AS avg_amount
+    FROM country_stats
+    ORDER BY total_amount desc;
+    """
+
+# Tabela podsumowań utrzymywana przyrostowo przez triggery na orders/customers:
+# odczyt to O(liczba krajów) niezależnie od liczby zamówień.
+# Wiersz kraju zakładany przez INSERT ... WHERE NOT EXISTS, nie INSERT OR IGNORE: klauzula
+# konfliktu w triggerze jest zastępowana przez klauzulę instrukcji zewnętrznej, więc pod
+# REPLACE INTO customers / UPDATE OR REPLACE stawałaby się REPLACE i zerowała liczniki kraju
+COUNTRY_STATS_DDL = """
+    CREATE TABLE country_stats
+    (
+        country TEXT PRIMARY KEY,
+        n_orders INTEGER NOT NULL DEFAULT 0,
+        total_amount REAL NOT NULL DEFAULT 0
+    ) WITHOUT ROWID;
+
+    CREATE TRIGGER customers_ai AFTER INSERT ON customers
+    BEGIN
+        INSERT INTO country_stats(country)
+        SELECT NEW.country WHERE NOT EXISTS (SELECT 1 FROM country_stats WHERE country = NEW.country);
+        -- zamówienia klienta wstawionego przez REPLACE (customers_ad je odjął)
+        UPDATE country_stats SET
+            n_orders = n_orders + (SELECT COUNT(*) FROM orders WHERE customer_id = NEW.customer_id),
+            total_amount = total_amount + (SELECT COALESCE(SUM(amount), 0) FROM orders WHERE customer_id = NEW.customer_id)
+        WHERE country = NEW.country;
+    END;
+
+    -- zmiana klucza: zamówienia starego klucza tracą klienta, nowego (jeśli są) trafiają do NEW.country
+    CREATE TRIGGER customers_au AFTER UPDATE OF country, customer_id ON customers
+    WHEN OLD.country <> NEW.country OR OLD.customer_id <> NEW.customer_id
+    BEGIN
+        INSERT INTO country_stats(country)
+        SELECT NEW.country WHERE NOT EXISTS (SELECT 1 FROM country_stats WHERE country = NEW.country);
+        UPDATE country_stats SET
+            n_orders = n_orders - (SELECT COUNT(*) FROM orders WHERE customer_id = OLD.customer_id),
+            total_amount = total_amount - (SELECT COALESCE(SUM(amount), 0) FROM orders WHERE customer_id = OLD.customer_id)
+        WHERE country = OLD.country;
+        UPDATE country_stats SET
+            n_orders = n_orders + (SELECT COUNT(*) FROM orders WHERE customer_id = NEW.customer_id),
+            total_amount = total_amount + (SELECT COALESCE(SUM(amount), 0) FROM orders WHERE customer_id = NEW.customer_id)
+        WHERE country = NEW.country;
+        DELETE FROM country_stats
+        WHERE country = OLD.country AND NOT EXISTS (SELECT 1 FROM customers WHERE country = OLD.country);
+    END;
+
+    CREATE TRIGGER customers_ad AFTER DELETE ON customers
+    BEGIN
+        UPDATE country_stats SET
+            n_orders = n_orders - (SELECT COUNT(*) FROM orders WHERE customer_id = OLD.customer_id),
+            total_amount = total_amount - (SELECT COALESCE(SUM(amount), 0) FROM orders WHERE customer_id = OLD.customer_id)
+        WHERE country = OLD.country;
+        DELETE FROM country_stats
+        WHERE country = OLD.country AND NOT EXISTS (SELECT 1 FROM customers WHERE country = OLD.country);
+    END;
+
+    CREATE TRIGGER orders_ai AFTER INSERT ON orders
+    BEGIN
+        UPDATE country_stats SET n_orders = n_orders + 1, total_amount = total_amount + NEW.amount
+        WHERE country = (SELECT country FROM customers WHERE customer_id = NEW.customer_id);
+    END;
+
+    CREATE TRIGGER orders_ad AFTER DELETE ON orders
+    BEGIN
+        UPDATE country_stats SET n_orders = n_orders - 1, total_amount = total_amount - OLD.amount
+        WHERE country = (SELECT country FROM customers WHERE customer_id = OLD.customer_id);
+    END;
+
+    CREATE TRIGGER orders_au AFTER UPDATE OF customer_id, amount ON orders
+    BEGIN
+        UPDATE country_stats SET n_orders = n_orders - 1, total_amount = total_amount - OLD.amount
+        WHERE country = (SELECT country FROM customers WHERE customer_id = OLD.customer_id);
+        UPDATE country_stats SET n_orders = n_orders + 1, total_amount = total_amount + NEW.amount
+        WHERE country = (SELECT country FROM customers WHERE customer_id = NEW.customer_id);
+    END;
+    """
+
+Q_PARAM = """
+    SELECT o.order_id, c.name, o.order_date, o.amount 
+    FROM orders o
+        join customers c on c.customer_id = o.customer_id
+    where o.amount >= ?
+    order by o.amount desc
+    """
+
+
+def connect(db_path: Path, pragmas: dict | None = DEFAULT_PRAGMAS) -> sqlite3.Connection:
+    # cached_statements: sqlite3 trzyma skompilowane (prepared) zapytania po tekście SQL
+    conn = sqlite3.connect(db_path, cached_statements=256)
+    for name, value in {**(pragmas or {}), **REQUIRED_PRAGMAS}.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+def create_indexes(conn: sqlite3.Connection, indexes: dict | None = DEFAULT_INDEXES):
+    for name, target in (indexes or {}).items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+    conn.execute("ANALYZE")  # statystyki dla planera
+    conn.commit()
+
+
+def generate_orders(conn: sqlite3.Connection, n_orders: int, n_customers: int = 10_000,
+                    seed: int = 42, batch_size: int = 500_000):
+    """Dokłada n_customers klientów i n_orders zamówień (wektorowo, porcjami) - skalowanie demo do milionów."""
+    rng = np.random.default_rng(seed)
+    first_customer = conn.execute("SELECT COALESCE(MAX(customer_id), 0) + 1 FROM customers").fetchone()[0]
+    first_order = conn.execute("SELECT COALESCE(MAX(order_id), 0) + 1 FROM orders").fetchone()[0]
+
+    customer_ids = np.arange(first_customer, first_customer + n_customers)
+    countries = np.array(COUNTRIES)[rng.integers(0, len(COUNTRIES), n_customers)]
+    conn.executemany(
+        "INSERT INTO customers VALUES (?,?,?)",
+        zip(customer_ids.tolist(), (f"Customer {i}" for i in customer_ids.tolist()), countries.tolist()),
+    )
+
+    start = np.datetime64("2025-01-01")
+    for offset in range(0, n_orders, batch_size):
+        n = min(batch_size, n_orders - offset)
+        order_ids = np.arange(first_order + offset, first_order + offset + n)
+        cust = rng.choice(customer_ids, n)
+        dates = (start + rng.integers(0, 365, n).astype("timedelta64[D]")).astype(str)
+        amounts = np.round(rng.gamma(2.0, 150.0, n), 2)
+        conn.executemany(
+            "INSERT INTO orders VALUES (?,?,?,?)",
+            zip(order_ids.tolist(), cust.tolist(), dates.tolist(), amounts.tolist()),
+        )
+    conn.commit()
+
+
+# Typy kolumn returns: return_id jako klucz główny (INTEGER PRIMARY KEY = rowid)
+RETURNS_SCHEMA = {
+    "return_id": "INTEGER",
+    "order_id": "INTEGER NOT NULL REFERENCES orders(order_id)",
+    "reason": "TEXT NOT NULL",
+}
+
+# Zadeklarowane typy wyników zapytań (read_typed): bez zgadywania dtype po wczytaniu
+CUSTOMERS_SCHEMA = {"customer_id": "int64", "name": "object", "country": "category"}
+ORDERS_SCHEMA = {"order_id": "int64", "customer_id": "int64", "order_date": "datetime64[D]", "amount": "float64"}
+COUNTRY_STATS_SCHEMA = {"country": "category", "n_orders": "int64", "total_amount": "float64", "avg_amount": "float64"}
+PARAM_SCHEMA = {"order_id": "int64", "name": "object", "order_date": "datetime64[D]", "amount": "float64"}
+RETURNS_JOIN_SCHEMA = {"return_id": "int64", "reason": "category", "order_id": "int64",
+                       "amount": "float64", "name": "object"}
+
+_SQLITE_TYPES = {"i": "INTEGER", "u": "INTEGER", "b": "INTEGER", "f": "REAL", "M": "TEXT"}
+
+
+def write_frame(conn: sqlite3.Connection, df: pd.DataFrame, table: str, primary_key: str | None = None,
+                column_types: dict | None = None, upsert: bool = True) -> int:
+    """
+    Dopisuje DataFrame do tabeli SQLite (zamiast to_sql(if_exists="replace")):
+    tabela z typami i kluczem głównym tworzona raz, kolumny zamieniane na listy jeden raz,
+    executemany po krotkach w jednej transakcji, opcjonalnie ON CONFLICT(pk) DO UPDATE.
+    """
+    columns = list(df.columns)
+    types = {c: _SQLITE_TYPES.get(df[c].dtype.kind, "TEXT") for c in columns}
+    types.update(column_types or {})
+    defs = [f"{c} {types[c]}" for c in columns]
+    if primary_key:
+        defs.append(f"PRIMARY KEY ({primary_key})")
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(defs)})")
+
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    if primary_key and upsert:
+        updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c != primary_key)
+        sql += f" ON CONFLICT({primary_key}) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING")
+
+    arrays = []
+    for c in columns:
+        col = df[c]
+        if col.dtype.kind == "M":
+            col = col.dt.strftime("%Y-%m-%d %H:%M:%S")
+        arrays.append(col.tolist())   # natywne typy Pythona, raz na kolumnę
+
+    with conn:  # jedna transakcja
+        conn.executemany(sql, zip(*arrays))
+    return len(df)
+
+
+def read_typed(conn: sqlite3.Connection, sql: str, schema: dict, params=(),
+               batch_size: int = 65_536) -> pd.DataFrame:
+    """
+    Wczytuje wynik zapytania do prealokowanych tablic NumPy o typach z schema
+    (pobieranie porcjami fetchmany, tablice powiększane x2). Daty parsowane raz, przy wpisaniu
+    porcji do tablicy datetime64; category zbierane jako tekst i kodowane na końcu.
+    Kolumny spoza schema -> object.
+    """
+    cur = conn.execute(sql, params)
+    names = [d[0] for d in cur.description]
+    dtypes = [schema.get(name, "object") for name in names]
+    # category: bufor tekstowy, kodowanie jednorazowe po wczytaniu
+    storage = [np.dtype(object) if dt == "category" else np.dtype(dt) for dt in dtypes]
+    capacity = batch_size
+    arrays = [np.empty(capacity, dtype=st) for st in storage]
+    n = 0
+    while batch := cur.fetchmany(batch_size):
+        k = len(batch)
+        if n + k > capacity:
+            capacity = max(2 * capacity, n + k)
+            for i, arr in enumerate(arrays):
+                grown = np.empty(capacity, dtype=arr.dtype)
+                grown[:n] = arr[:n]
+                arrays[i] = grown
+        for arr, values in zip(arrays, zip(*batch)):
+            arr[n:n + k] = values
+        n += k
+
+    data = {}
+    for name, dt, arr in zip(names, dtypes, arrays):
+        arr = arr[:n]
+        data[name] = pd.Categorical(arr) if dt == "category" else arr
+    return pd.DataFrame(data, copy=False)
+
+
+def rebuild_country_stats(conn: sqlite3.Connection):
+    """Przelicza country_stats od zera (np. po naprawie danych z pominięciem triggerów)."""
+    conn.execute("DELETE FROM country_stats")
+    conn.execute(f"INSERT INTO country_stats(country, n_orders, total_amount) {Q_JOIN_AGG_RAW}")
+    conn.commit()
+
+
+def check_country_stats(conn: sqlite3.Connection, rel_tol: float = 1e-9) -> pd.DataFrame:
+    """Porównuje country_stats z pełnym zapytaniem; zwraca wiersze niezgodne (pusty DataFrame = OK)."""
+    full = pd.read_sql_query(Q_JOIN_AGG_RAW, conn).set_index("country")
+    mat = pd.read_sql_query("SELECT * FROM country_stats", conn).set_index("country")
+    both = full.join(mat, how="outer", lsuffix="_full", rsuffix="_mat")
+    # puste tabele dają kolumny object - isclose wymaga liczb
+    amounts = both[["total_amount_full", "total_amount_mat"]].astype(float)
+    amount_ok = np.isclose(amounts["total_amount_full"], amounts["total_amount_mat"], rtol=rel_tol, atol=1e-6)
+    counts_ok = both["n_orders_full"] == both["n_orders_mat"]
+    return both[~(amount_ok & counts_ok)]
+
+
+# Zapisy, po których country_stats musi się zgadzać z pełnym zapytaniem (każdy na świeżej bazie demo)
+COUNTRY_STATS_WRITE_CASES = {
+    "REPLACE klienta do kraju z innymi klientami": [
+        "REPLACE INTO customers VALUES (2, 'John Smith', 'PL')",
+    ],
+    "UPDATE OR REPLACE kraju klienta": [
+        "UPDATE OR REPLACE customers SET country = 'PL' WHERE customer_id = 2",
+    ],
+    "REPLACE zamówienia (zmiana klienta i kwoty)": [
+        "REPLACE INTO orders VALUES (101, 2, '2025-01-10', 300.0)",
+    ],
+    "zmiana kraju i usunięcie ostatniego klienta kraju": [
+        "UPDATE customers SET country = 'DE' WHERE customer_id = 5",
+        "DELETE FROM customers WHERE customer_id = 6",
+    ],
+    "zmiana klucza klienta (zamówienia bez klienta)": [
+        "UPDATE customers SET customer_id = 99 WHERE customer_id = 1",
+    ],
+    "UPDATE OR REPLACE klucza na klucz innego klienta": [
+        "UPDATE OR REPLACE customers SET customer_id = 4 WHERE customer_id = 2",
+    ],
+    "usunięcie wszystkich danych": [
+        "DELETE FROM orders",
+        "DELETE FROM customers",
+    ],
+}
+
+
+def check_country_stats_writes(pragmas: dict | None = DEFAULT_PRAGMAS) -> dict:
+    """
+    Wykonuje każdy przypadek z COUNTRY_STATS_WRITE_CASES na świeżej bazie demo w pamięci
+    i porównuje country_stats z pełnym zapytaniem; zwraca {opis: niezgodne wiersze} (pusty = OK).
+    """
+    failures = {}
+    for label, statements in COUNTRY_STATS_WRITE_CASES.items():
+        conn = init_db(":memory:", pragmas=pragmas)
+        with conn:
+            for sql in statements:
+                conn.execute(sql)
+        mismatches = check_country_stats(conn)
+        conn.close()
+        if not mismatches.empty:
+            failures[label] = mismatches
+    return failures
+
+
+def init_db(db_path: Path, indexes: dict | None = DEFAULT_INDEXES, pragmas: dict | None = DEFAULT_PRAGMAS):
+    conn = connect(db_path, pragmas)
     cur = conn.cursor()
     cur.executescript("""
     DROP TABLE IF EXISTS customers;
     DROP TABLE IF EXISTS orders;
+    DROP TABLE IF EXISTS country_stats;
+    DROP TABLE IF EXISTS returns;
     
     CREATE TABLE customers
     (
@@ -29,6 +360,7 @@ def init_db(db_path: Path):
         
         
     """)
+    cur.executescript(COUNTRY_STATS_DDL)
 
     customers = [
         (1,"Anna Kowalska","PL"),
@@ -57,46 +389,34 @@ def init_db(db_path: Path):
     cur.executemany("INSERT INTO orders VALUES (?,?,?,?)", orders)
 
     conn.commit()
+    create_indexes(conn, indexes)
     return conn
 
 def main():
     conn = init_db(DB_PATH)
 
     #proste SELECT
-    df_customers = pd.read_sql_query("SELECT * FROM customers", conn)
-    df_orders = pd.read_sql_query("SELECT * FROM orders", conn)
+    df_customers = read_typed(conn, "SELECT * FROM customers", CUSTOMERS_SCHEMA)
+    df_orders = read_typed(conn, "SELECT * FROM orders", ORDERS_SCHEMA)
 
     print(f"\n[Customers]\n{df_customers}\n")
     print(f"\n[Orders]\n{df_orders}\n")
 
     #JOIN + GOUP BY
-    q_join_agg = """
-    SELECT
-        c.country,
-        COUNT(o.order_id) AS n_orders,
-        ROUND(SUM(o.amount)) AS total_amount,
-        ROUND(AVG(o.amount)) AS avg_amount
-    FROM
-        customers AS c
-    LEFT JOIN orders o ON o.customer_id = c.customer_id
-    GROUP BY c.country
-    ORDER BY total_amount desc;
-    """
-
-    df_country_stats = pd.read_sql_query(q_join_agg, conn)
+    df_country_stats = read_typed(conn, Q_JOIN_AGG, COUNTRY_STATS_SCHEMA)
     print(f"\n[Country Stats]\n{df_country_stats}\n")
 
+    #to samo z tabeli zmaterializowanej (triggery) + kontrola spójności
+    df_country_stats_mat = read_typed(conn, Q_COUNTRY_STATS, COUNTRY_STATS_SCHEMA)
+    print(f"\n[Country Stats - materialized]\n{df_country_stats_mat}\n")
+    mismatches = check_country_stats(conn)
+    print(f"Spójność country_stats: {'OK' if mismatches.empty else mismatches}\n")
+    failures = check_country_stats_writes()
+    print(f"Spójność country_stats po zapisach: {'OK' if not failures else failures}\n")
+
     #zapytanie parametryzowane
     min_amount = 200.0
-    q_param = """
-    SELECT o.order_id, c.name, o.order_date, o.amount 
-    FROM orders o
-        join customers c on c.customer_id = o.customer_id
-    where o.amount >= ?
-    order by o.amount desc
-    """
-
-    df_param = pd.read_sql_query(q_param, conn, params=(min_amount,))
+    df_param = read_typed(conn, Q_PARAM, PARAM_SCHEMA, params=(min_amount,))
     print(f"\n[Orders with amount >= {min_amount}]\n{df_param}\n")
 
     #zpisanie DataFrame do bazy danych
@@ -106,7 +426,7 @@ def main():
     "reason": ["bad quality", "wrong size", "wrong color", "too expensive", "too cheap", "not delivered"]
     })
 
-    returns_df.to_sql("returns", conn, if_exists="replace", index=False)
+    write_frame(conn, returns_df, "returns", primary_key="return_id", column_types=RETURNS_SCHEMA)
 
     #JOIN z nową tabelą
     q_returns = """
@@ -123,7 +443,7 @@ def main():
     ORDER BY r.return_id
     """
 
-    df_returns = pd.read_sql_query(q_returns, conn)
+    df_returns = read_typed(conn, q_returns, RETURNS_JOIN_SCHEMA)
     print(f"\n[Returns]\n{df_returns}\n")
 if __name__ == '__main__':
     main()
@@ -0,0 +1,134 @@
+"""
+Benchmark bazy sklepu (pandas_sql.py) w skali milionów zamówień:
+opóźnienia zapytań demo bez indeksów i z domyślnymi PRAGMA vs schemat strojony (indeksy + WAL + cache/mmap).
+
+Uruchomienie:
+    python shop_benchmark.py [liczba_zamówień] [liczba_klientów]
+"""
+
+from __future__ import annotations
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from pandas_sql import (
+    DEFAULT_PRAGMAS, ORDERS_SCHEMA, Q_COUNTRY_STATS, Q_JOIN_AGG, Q_PARAM, RETURNS_SCHEMA,
+    create_indexes, generate_orders, init_db, read_typed, write_frame,
+)
+
+QUERIES = {
+    "join_agg": (Q_JOIN_AGG, ()),
+    "country_stats": (Q_COUNTRY_STATS, ()),
+    "amount >= 900": (Q_PARAM, (900.0,)),
+}
+
+
+def time_queries(conn, repeat: int = 3) -> dict[str, float]:
+    """Mediana czasu [ms] pełnego pobrania wyników (fetchall) dla każdego zapytania."""
+    out = {}
+    for name, (sql, params) in QUERIES.items():
+        samples = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            samples.append(time.perf_counter() - t0)
+        out[name] = 1000 * float(np.median(samples))
+    return out
+
+
+def build(db_path: Path, n_orders: int, n_customers: int, tuned: bool):
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    conn = init_db(db_path, indexes=None, pragmas=DEFAULT_PRAGMAS if tuned else None)
+    t0 = time.perf_counter()
+    generate_orders(conn, n_orders, n_customers)
+    if tuned:
+        create_indexes(conn)   # indeksy po załadowaniu - szybciej niż utrzymywanie ich w trakcie
+    load_s = time.perf_counter() - t0
+    return conn, load_s
+
+
+def bench_returns(db_path: Path, n_returns: int = 1_000_000) -> dict[str, float]:
+    """Zapis n_returns zwrotów: returns_df.to_sql(if_exists="replace") vs write_frame (append i upsert)."""
+    rng = np.random.default_rng(42)
+    reasons = np.array(["bad quality", "wrong size", "wrong color", "too expensive", "too cheap", "not delivered"])
+    returns_df = pd.DataFrame({
+        "return_id": np.arange(1, n_returns + 1),
+        "order_id": rng.integers(1, n_returns, n_returns),
+        "reason": reasons[rng.integers(0, len(reasons), n_returns)],
+    })
+    conn = init_db(db_path)
+    out = {}
+
+    t0 = time.perf_counter()
+    returns_df.to_sql("returns", conn, if_exists="replace", index=False)
+    out["to_sql replace"] = time.perf_counter() - t0
+
+    conn.execute("DROP TABLE returns")
+    t0 = time.perf_counter()
+    write_frame(conn, returns_df, "returns", primary_key="return_id", column_types=RETURNS_SCHEMA)
+    out["write_frame (insert)"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    write_frame(conn, returns_df, "returns", primary_key="return_id", column_types=RETURNS_SCHEMA)
+    out["write_frame (upsert)"] = time.perf_counter() - t0
+    conn.close()
+
+    print(f"\nZapis {n_returns:,} zwrotów:")
+    for name, seconds in out.items():
+        print(f"  {name:<22}{seconds:>8.2f} s")
+    return out
+
+
+def bench_read(conn) -> dict[str, tuple[float, float]]:
+    """Odczyt całej tabeli orders: pd.read_sql_query (+ parsowanie daty) vs read_typed -> (s, szczyt MiB)."""
+    readers = {
+        "read_sql_query": lambda: pd.read_sql_query("SELECT * FROM orders", conn, parse_dates=["order_date"]),
+        "read_typed": lambda: read_typed(conn, "SELECT * FROM orders", ORDERS_SCHEMA),
+    }
+    out = {}
+    for name, read in readers.items():
+        t0 = time.perf_counter()
+        read()
+        seconds = time.perf_counter() - t0
+        # szczyt pamięci w osobnym przebiegu - tracemalloc sam spowalnia alokacje
+        tracemalloc.start()
+        read()
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        out[name] = (seconds, peak)
+
+    print("\nOdczyt tabeli orders:")
+    for name, (seconds, peak) in out.items():
+        print(f"  {name:<16}{seconds:>8.2f} s{peak:>10.1f} MiB")
+    return out
+
+
+def main(n_orders: int = 1_000_000, n_customers: int = 200):
+    # Bez indeksu na orders.customer_id JOIN to pętla zagnieżdżona: koszt ~ klienci x zamówienia,
+    # dlatego wariant "przed" ma niewielu klientów
+    results = {}
+    for label, tuned in (("przed", False), ("po", True)):
+        conn, load_s = build(Path(f"shop_bench_{label}.db"), n_orders, n_customers, tuned)
+        results[label] = time_queries(conn)
+        if tuned:
+            bench_read(conn)
+        print(f"[{label}] ładowanie {n_orders:,} zamówień (+ indeksy): {load_s:.2f} s")
+        conn.close()
+
+    print(f"\n{'zapytanie':<16}{'przed [ms]':>12}{'po [ms]':>12}{'przyspieszenie':>16}")
+    for name in QUERIES:
+        before, after = results["przed"][name], results["po"][name]
+        print(f"{name:<16}{before:>12.1f}{after:>12.1f}{before / after:>15.1f}x")
+
+    bench_returns(Path("shop_bench_returns.db"))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -11,6 +11,9 @@ Wymagania:
 Uruchomienie (np.):
     python tasks_solution.py
 
+Duże pliki benchmarkowe (porcjami, opcjonalnie równolegle w shardach):
+    make_csv_chunked("sales", Path("."), n=50_000_000, chunk_size=1_000_000, shards=True, processes=8)
+
 Pliki wyjściowe:
     - sales.csv
     - times_10k.csv
@@ -20,41 +23,40 @@ Pliki wyjściowe:
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
-import random
 from pathlib import Path
 
 
-def make_sales_csv(path: Path, n: int = 300, seed: int = 42) -> Path:
-    rng = np.random.default_rng(seed)
-    customers = [
-        "Kowalski", "Nowak", "Wiśniewski", "Wójcik", "Kamiński", "Lewandowski",
-        "Zieliński", "Szymański", "Woźniak", "Dąbrowski", "Kozłowski", "Jankowski",
-        "Mazur", "Krawczyk", "Kaczmarek", "Piotrowski", "Grabowski", "Zając",
-        "Pawłowski", "Michalski"
-    ]
-    categories = ["electronics", "books", "home", "fashion", "sports", "toys", "beauty"]
-
-    start_date = datetime(2024, 1, 1)
-    end_date = datetime(2025, 8, 1)
-    date_range_days = (end_date - start_date).days
-
-    order_ids = [f"ORD{100000+i}" for i in range(n)]
+SALES_CUSTOMERS = [
+    "Kowalski", "Nowak", "Wiśniewski", "Wójcik", "Kamiński", "Lewandowski",
+    "Zieliński", "Szymański", "Woźniak", "Dąbrowski", "Kozłowski", "Jankowski",
+    "Mazur", "Krawczyk", "Kaczmarek", "Piotrowski", "Grabowski", "Zając",
+    "Pawłowski", "Michalski"
+]
+SALES_CATEGORIES = ["electronics", "books", "home", "fashion", "sports", "toys", "beauty"]
+SALES_CATEGORY_P = [0.25, 0.15, 0.15, 0.15, 0.1, 0.1, 0.1]
+
+
+def _sales_frame(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    start_date = np.datetime64("2024-01-01")
+    date_range_days = int((np.datetime64("2025-08-01") - start_date) // np.timedelta64(1, "D"))
+
     sales_df = pd.DataFrame({
-        "order_id": order_ids,
-        "customer": rng.choice(customers, size=n),
-        "category": rng.choice(categories, size=n, p=[0.25,0.15,0.15,0.15,0.1,0.1,0.1]),
+        "order_id": np.char.add("ORD", np.arange(100000 + start, 100000 + start + n).astype(str)),
+        "customer": rng.choice(SALES_CUSTOMERS, size=n),
+        "category": rng.choice(SALES_CATEGORIES, size=n, p=SALES_CATEGORY_P),
         "amount": np.round(rng.gamma(shape=2.0, scale=150.0, size=n) + rng.normal(0, 20, n), 2),
-        "order_date": [
-            (start_date + timedelta(days=int(rng.integers(0, date_range_days)))).strftime("%Y-%m-%d")
-            for _ in range(n)
-        ]
+        # jedno losowanie dni + arytmetyka datetime64 (te same liczby co losowanie per wiersz)
+        "order_date": start_date + rng.integers(0, date_range_days, size=n).astype("timedelta64[D]"),
     })
     # Bez wartości ujemnych po dodanym szumie
     sales_df["amount"] = sales_df["amount"].clip(lower=5.0)
+    return sales_df
+
+
+def make_sales_csv(path: Path, n: int = 300, seed: int = 42) -> Path:
     out = path / "sales.csv"
-    sales_df.to_csv(out, index=False)
+    _sales_frame(np.random.default_rng(seed), 0, n).to_csv(out, index=False)
     return out
 
 
@@ -83,16 +85,18 @@ def solve_sales(csv_path: Path) -> dict:
     }
 
 
-def make_times_csv(path: Path, n: int = 300, seed: int = 42) -> Path:
-    rng = np.random.default_rng(seed)
+def _times_frame(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
     times = rng.normal(loc=50, scale=5, size=n)
     times = np.clip(times, 35, 75)
-    times_df = pd.DataFrame({
-        "runner_id": [f"R{str(i+1).zfill(3)}" for i in range(n)],
+    return pd.DataFrame({
+        "runner_id": np.char.add("R", np.char.zfill(np.arange(start + 1, start + n + 1).astype(str), 3)),
         "time_min": np.round(times, 2)
     })
+
+
+def make_times_csv(path: Path, n: int = 300, seed: int = 42) -> Path:
     out = path / "times_10k.csv"
-    times_df.to_csv(out, index=False)
+    _times_frame(np.random.default_rng(seed), 0, n).to_csv(out, index=False)
     return out
 
 
@@ -121,37 +125,90 @@ def solve_times(csv_path: Path) -> dict:
     }
 
 
+RACE_NAMES = [
+    "Anna", "Piotr", "Kasia", "Marek", "Ewa", "Tomek", "Magda", "Paweł", "Agnieszka", "Krzysztof",
+    "Monika", "Rafał", "Ola", "Michał", "Dorota", "Bartek", "Karolina", "Łukasz", "Natalia", "Adam",
+    "Justyna", "Sebastian", "Iwona", "Damian", "Beata", "Grzegorz", "Patrycja", "Hubert", "Eliza", "Wojtek"
+]
+RACE_TYPES = ["10K", "Half"]
+
+
+def _races_frame(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    # Całość z jednego generatora NumPy (bez random.choice i pętli po wierszach)
+    start_date = np.datetime64("2025-01-01")
+    date_range_days = int((np.datetime64("2025-08-01") - start_date) // np.timedelta64(1, "D"))
+
+    names = np.asarray(RACE_NAMES)[rng.integers(0, len(RACE_NAMES), size=n)]
+    is_10k = rng.integers(0, len(RACE_TYPES), size=n) == 0
+    z = rng.standard_normal(n)
+    times = np.where(
+        is_10k,
+        np.clip(50 + 6 * z, 34, 80),      # 10K: N(50, 6)
+        np.clip(120 + 12 * z, 80, 200),   # Half: N(120, 12)
+    )
+    races_df = pd.DataFrame({
+        "name": names,
+        "race": np.where(is_10k, RACE_TYPES[0], RACE_TYPES[1]),
+        "time_min": np.round(times, 2),
+        "date": start_date + rng.integers(0, date_range_days, size=n).astype("timedelta64[D]"),
+    })
+    return races_df
+
+
 def make_races_csv(path: Path, n: int = 300, seed: int = 42) -> Path:
-    rng = np.random.default_rng(seed)
-    random.seed(seed)
-    names_pool = [
-        "Anna", "Piotr", "Kasia", "Marek", "Ewa", "Tomek", "Magda", "Paweł", "Agnieszka", "Krzysztof",
-        "Monika", "Rafał", "Ola", "Michał", "Dorota", "Bartek", "Karolina", "Łukasz", "Natalia", "Adam",
-        "Justyna", "Sebastian", "Iwona", "Damian", "Beata", "Grzegorz", "Patrycja", "Hubert", "Eliza", "Wojtek"
-    ]
-    race_types = ["10K", "Half"]
-
-    def random_date(start, end, _rng):
-        days = int((end - start).days)
-        return (start + timedelta(days=int(_rng.integers(0, days)))).strftime("%Y-%m-%d")
-
-    rows = []
-    for _ in range(n):
-        name = random.choice(names_pool)
-        race = random.choice(race_types)
-        if race == "10K":
-            t = np.clip(rng.normal(50, 6), 34, 80)
-        else:
-            t = np.clip(rng.normal(120, 12), 80, 200)
-        date_str = random_date(datetime(2025,1,1), datetime(2025,8,1), rng)
-        rows.append({"name": name, "race": race, "time_min": round(float(t), 2), "date": date_str})
-
-    races_df = pd.DataFrame(rows)
     out = path / "races.csv"
-    races_df.to_csv(out, index=False)
+    _races_frame(np.random.default_rng(seed), 0, n).to_csv(out, index=False)
     return out
 
 
+# ---------- Generowanie porcjami (duże pliki benchmarkowe) ----------
+DATASETS = {
+    "sales": (_sales_frame, "sales"),
+    "times": (_times_frame, "times_10k"),
+    "races": (_races_frame, "races"),
+}
+
+
+def _write_chunk(kind: str, out: Path, seed_seq: np.random.SeedSequence,
+                 start: int, n: int, header: bool, mode: str) -> Path:
+    make_frame, _ = DATASETS[kind]
+    make_frame(np.random.default_rng(seed_seq), start, n).to_csv(out, index=False, header=header, mode=mode)
+    return out
+
+
+def make_csv_chunked(kind: str, path: Path, n: int, seed: int = 42, chunk_size: int = 1_000_000,
+                     shards: bool = False, processes: int = 0) -> list:
+    """
+    Generuje zbiór kind ("sales" / "times" / "races") porcjami po chunk_size wierszy,
+    więc w pamięci jest zawsze tylko jedna porcja. Każda porcja ma własny strumień RNG
+    z SeedSequence(seed).spawn(), więc wynik zależy tylko od (seed, n, chunk_size),
+    a nie od liczby procesów.
+
+    shards=False: jeden plik <nazwa>.csv dopisywany porcja po porcji.
+    shards=True: osobny plik <nazwa>-00000.csv na porcję; processes > 1 -> równolegle w puli procesów.
+    Zwraca listę zapisanych plików.
+    """
+    _, stem = DATASETS[kind]
+    starts = list(range(0, n, chunk_size))
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    sizes = [min(chunk_size, n - start) for start in starts]
+
+    if not shards:
+        out = path / f"{stem}.csv"
+        for i, (start, size, seed_seq) in enumerate(zip(starts, sizes, seeds)):
+            _write_chunk(kind, out, seed_seq, start, size, header=(i == 0), mode="w" if i == 0 else "a")
+        return [out]
+
+    outs = [path / f"{stem}-{i:05d}.csv" for i in range(len(starts))]
+    jobs = [(kind, out, seed_seq, start, size, True, "w")
+            for out, seed_seq, start, size in zip(outs, seeds, starts, sizes)]
+    if processes > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            return list(pool.map(_write_chunk, *zip(*jobs)))
+    return [_write_chunk(*job) for job in jobs]
+
+
 def solve_races(csv_path: Path, plot_path: Path) -> dict:
     df = pd.read_csv(csv_path, parse_dates=["date"])
     mean_times_by_race = df.groupby("race", as_index=False)["time_min"].mean()
@@ -0,0 +1,36 @@
+"""
+Konwersja data/*.csv do formatu kolumnowego (Parquet domyślnie, albo Feather), z typami
+zadań zapisanymi w pliku - kolejne uruchomienia main.py nie parsują już CSV ani dat.
+sales jest sortowany po kategorii, więc filtr category == "electronics" czyta tylko
+grupy wierszy tej kategorii.
+
+Uruchomienie (wymaga pyarrow):
+    python convert_data.py [parquet|feather]
+"""
+
+import sys
+from pathlib import Path
+
+from tasks.sales_task import SALES_DTYPES, SALES_PARSE_DATES
+from tasks.race_store import RACES_DTYPES, RACES_PARSE_DATES
+from utils.io import convert_csv
+
+# plik -> (dtype, parse_dates, sort_by)
+CONVERSIONS = {
+    "sales.csv": (SALES_DTYPES, SALES_PARSE_DATES, ["category"]),
+    "times_10k.csv": ({"time_min": "float64"}, None, None),
+    "races.csv": (RACES_DTYPES, RACES_PARSE_DATES, None),
+}
+
+
+def convert_all(data_dir: Path, fmt: str = "parquet") -> list:
+    out = []
+    for name, (dtype, parse_dates, sort_by) in CONVERSIONS.items():
+        out.append(convert_csv(data_dir / name, fmt, dtype=dtype, parse_dates=parse_dates, sort_by=sort_by))
+    return out
+
+
+if __name__ == "__main__":
+    fmt = sys.argv[1] if len(sys.argv) > 1 else "parquet"
+    for path in convert_all(Path(__file__).resolve().parent / "data", fmt):
+        print("Zapisano:", path)
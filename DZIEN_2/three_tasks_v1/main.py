@@ -3,6 +3,16 @@ from pathlib import Path
 from tasks.sales_task import solve_sales
 from tasks.times_task import solve_times
 from tasks.races_task import solve_races
+from utils.scheduler import Task, run_tasks
+from utils.cache import cached_call
+from utils.io import columnar_path
+from utils.binary_cache import is_fresh
+
+
+def input_path(csv_path: Path) -> Path:
+    # Parquet z convert_data.py, jeśli jest aktualny; inaczej CSV
+    parquet = columnar_path(csv_path)
+    return parquet if is_fresh(csv_path, parquet) else csv_path
 
 
 def main():
@@ -11,15 +21,24 @@ def main():
     out = base / "output"
     out.mkdir(parents=True, exist_ok=True)
 
-    # 1) Ścieżki do gotowych CSV
-    sales_csv = data_dir / "sales.csv"
-    times_csv = data_dir / "times_10k.csv"
-    races_csv = data_dir / "races.csv"
-
-    # 2) Uruchom zadania
-    sales_result = solve_sales(sales_csv)
-    times_result = solve_times(times_csv)
-    races_result = solve_races(races_csv, out / "race_means.png")
+    # 1) Ścieżki do gotowych CSV (albo ich wersji Parquet)
+    sales_csv = input_path(data_dir / "sales.csv")
+    times_csv = input_path(data_dir / "times_10k.csv")
+    races_csv = input_path(data_dir / "races.csv")
+
+    # 2) Uruchom zadania (niezależne -> równolegle w puli procesów);
+    #    wyniki z cache, dopóki nie zmienią się pliki wejściowe ani kod zadania (z importami)
+    plot_path = out / "race_means.png"
+    tasks = [
+        Task("sales", cached_call, (solve_sales, sales_csv), {"inputs": (sales_csv,)}),
+        Task("times", cached_call, (solve_times, times_csv), {"inputs": (times_csv,)}),
+        Task("races", cached_call, (solve_races, races_csv, plot_path),
+             {"inputs": (races_csv,), "outputs": (plot_path,)}),
+    ]
+    results, stats = run_tasks(tasks)
+    sales_result = results["sales"]
+    times_result = results["times"]
+    races_result = results["races"]
 
     # Rozpakuj wyniki, NIE nadpisuj nazw stringami
     top3_customers = sales_result["top3_customers"]
@@ -51,6 +70,11 @@ def main():
     print("\n[ZADANIE 3] Najlepszy czas każdego zawodnika (top 10):")
     print(best_time_per_runner.head(10).to_string(index=False))
 
+    print("\n[CZASY ZADAŃ]")
+    for name, st in stats.items():
+        growth = f"{st['rss_growth_mib']:.1f} MiB" if st["rss_growth_mib"] is not None else "-"
+        print(f"  {name:<8} {st['wall_s']:.3f} s, przyrost szczytu RSS: {growth}")
+
     print("\nWyniki i wykres zapisano w folderze:", out)
 
 
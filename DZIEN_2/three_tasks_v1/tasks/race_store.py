@@ -0,0 +1,202 @@
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+from utils.io import read_table
+
+# Zawodnik i kategoria jako category już przy parsowaniu CSV - kody bez osobnego factorize
+RACES_DTYPES = {"name": "category", "race": "category", "time_min": "float64"}
+RACES_PARSE_DATES = ["date"]
+
+class RaceStore:
+    """
+    Wyniki biegów wczytane raz: zawodnik i kategoria biegu jako kody int (słowniki rosną
+    przy dopisywaniu), czas i data jako tablice numpy. Agregaty (najlepszy czas zawodnika,
+    suma i liczba czasów na kategorię) są aktualizowane przy append, więc zapytania o nie
+    kosztują O(liczba zawodników/kategorii), a nie O(n). Indeks dat to kilka posortowanych
+    serii (jak w drzewie LSM): append dokłada serię nowej porcji, a serie o podobnej wielkości
+    są scalane, więc istniejące dane nie są kopiowane przy każdym append (amortyzowane
+    O(log n) na wiersz); zakres dat to searchsorted w każdej serii. Indeks wierszy per
+    zawodnik i per kategoria to listy porcji numerów wierszy, dopisywane przy append
+    i sklejane przy pierwszym odczycie danej grupy.
+    """
+
+    def __init__(self):
+        self.names: list = []
+        self.races: list = []
+        self._name_code: dict = {}
+        self._race_code: dict = {}
+        self._size = 0
+        self._name = np.empty(0, dtype=np.int32)
+        self._race = np.empty(0, dtype=np.int32)
+        self._time = np.empty(0, dtype=np.float64)
+        self._date = np.empty(0, dtype="datetime64[D]")
+        self._best = np.empty(0, dtype=np.float64)
+        self._race_sum = np.empty(0, dtype=np.float64)
+        self._race_count = np.empty(0, dtype=np.int64)
+        self._date_runs: list = []     # serie (posortowane daty, numery wierszy), od najstarszej
+        self._rows_by_name: list = []  # kod zawodnika -> lista porcji numerów wierszy
+        self._rows_by_race: list = []
+
+    @classmethod
+    def from_file(cls, path: Path) -> "RaceStore":
+        """Wczytuje CSV albo Parquet/Feather (wybór po rozszerzeniu)."""
+        store = cls()
+        store.append(read_table(path, dtype=RACES_DTYPES, parse_dates=RACES_PARSE_DATES))
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ------------------------
+    # DOPISYWANIE
+    # ------------------------
+    @staticmethod
+    def _encode(values: pd.Series, labels: list, lookup: dict) -> np.ndarray:
+        # kody w obrębie porcji, potem mapowanie na kody magazynu (nowe etykiety na koniec słownika)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            local, uniques = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            local, uniques = pd.factorize(values)
+        mapping = np.empty(len(uniques), dtype=np.int32)
+        for i, label in enumerate(uniques):
+            code = lookup.get(label)
+            if code is None:
+                code = lookup[label] = len(labels)
+                labels.append(label)
+            mapping[i] = code
+        codes = mapping[local] if len(uniques) else np.full(len(local), -1, dtype=np.int32)
+        codes[local < 0] = -1   # brak wartości
+        return codes
+
+    def _grow(self, n_new: int) -> None:
+        # podwajanie pojemności - amortyzowane O(1) na wiersz
+        need = self._size + n_new
+        if need <= self._time.size:
+            return
+        cap = max(need, 2 * self._time.size, 1024)
+        for attr in ("_name", "_race", "_time", "_date"):
+            old = getattr(self, attr)
+            new = np.empty(cap, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, attr, new)
+
+    @staticmethod
+    def _extend(arr: np.ndarray, size: int, fill) -> np.ndarray:
+        if size <= arr.size:
+            return arr
+        return np.concatenate([arr, np.full(size - arr.size, fill, dtype=arr.dtype)])
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Dopisuje wiersze (kolumny name, race, time_min, date) bez przebudowy istniejących danych."""
+        n = len(df)
+        if n == 0:
+            return
+        name = self._encode(df["name"], self.names, self._name_code)
+        race = self._encode(df["race"], self.races, self._race_code)
+        time = df["time_min"].to_numpy(dtype=np.float64)
+        date = pd.to_datetime(df["date"]).to_numpy().astype("datetime64[D]")
+
+        start = self._size
+        self._grow(n)
+        self._name[start:start + n] = name
+        self._race[start:start + n] = race
+        self._time[start:start + n] = time
+        self._date[start:start + n] = date
+        self._size += n
+
+        # agregaty: fmin pomija NaN (jak groupby.min), brak czasu nie wchodzi do średniej
+        self._best = self._extend(self._best, len(self.names), np.inf)
+        self._race_sum = self._extend(self._race_sum, len(self.races), 0.0)
+        self._race_count = self._extend(self._race_count, len(self.races), 0)
+        ok = (name >= 0) & ~np.isnan(time)
+        np.fmin.at(self._best, name[ok], time[ok])
+        ok = (race >= 0) & ~np.isnan(time)
+        self._race_sum += np.bincount(race[ok], weights=time[ok], minlength=len(self.races))
+        self._race_count += np.bincount(race[ok], minlength=len(self.races))
+
+        # indeks dat: nowa posortowana seria + scalanie serii o podobnej wielkości
+        order = np.argsort(date, kind="stable")
+        self._date_runs.append((date[order], order + start))
+        while len(self._date_runs) > 1 and self._date_runs[-1][0].size * 2 >= self._date_runs[-2][0].size:
+            (d1, r1), (d2, r2) = self._date_runs[-2:]
+            dates, rows = np.concatenate([d1, d2]), np.concatenate([r1, r2])
+            merged = np.argsort(dates, kind="stable")   # starsze wiersze przed nowszymi przy równych datach
+            self._date_runs[-2:] = [(dates[merged], rows[merged])]
+
+        self._add_to_groups(self._rows_by_name, name, start, len(self.names))
+        self._add_to_groups(self._rows_by_race, race, start, len(self.races))
+
+    # ------------------------
+    # ZAPYTANIA
+    # ------------------------
+    def best_time_per_runner(self) -> pd.DataFrame:
+        best = np.where(np.isinf(self._best), np.nan, self._best)
+        return (
+            pd.DataFrame({"name": self.names, "best_time_min": best})
+            .sort_values("name")
+            .sort_values("best_time_min", kind="stable")
+        )
+
+    def best_time(self, name: str) -> float:
+        best = self._best[self._name_code[name]]
+        return float("nan") if np.isinf(best) else float(best)
+
+    def mean_times_by_race(self) -> pd.DataFrame:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self._race_sum / self._race_count
+        return (
+            pd.DataFrame({"race": self.races, "time_min": mean})
+            .sort_values("race", ignore_index=True)
+        )
+
+    def _frame(self, idx: np.ndarray) -> pd.DataFrame:
+        names = pd.Categorical.from_codes(self._name[idx], categories=pd.Index(self.names, dtype=object))
+        races = pd.Categorical.from_codes(self._race[idx], categories=pd.Index(self.races, dtype=object))
+        return pd.DataFrame({
+            "name": names,
+            "race": races,
+            "time_min": self._time[idx],
+            "date": self._date[idx].astype("datetime64[ns]"),
+        })
+
+    def between(self, start, end) -> pd.DataFrame:
+        """Wiersze z datą w przedziale [start, end] (posortowane po dacie)."""
+        lo_date = np.datetime64(pd.Timestamp(start), "D")
+        hi_date = np.datetime64(pd.Timestamp(end), "D")
+        dates, rows = [], []
+        for run_dates, run_rows in self._date_runs:
+            lo = np.searchsorted(run_dates, lo_date, side="left")
+            hi = np.searchsorted(run_dates, hi_date, side="right")
+            dates.append(run_dates[lo:hi])
+            rows.append(run_rows[lo:hi])
+        if not rows:
+            return self._frame(np.empty(0, dtype=np.int64))
+        # sortowanie tylko wyniku; serie od najstarszej -> przy równych datach kolejność dopisywania
+        order = np.argsort(np.concatenate(dates), kind="stable")
+        return self._frame(np.concatenate(rows)[order])
+
+    @staticmethod
+    def _add_to_groups(groups: list, codes: np.ndarray, start: int, n_groups: int) -> None:
+        # numery wierszy nowej porcji dopisywane jako kolejna porcja do list swoich grup
+        groups.extend([] for _ in range(n_groups - len(groups)))
+        valid = np.flatnonzero(codes >= 0)
+        order = valid[np.argsort(codes[valid], kind="stable")]
+        present, first = np.unique(codes[order], return_index=True)
+        for code, rows in zip(present, np.split(order + start, first[1:])):
+            groups[code].append(rows)
+
+    @staticmethod
+    def _group_rows(groups: list, code: int) -> np.ndarray:
+        chunks = groups[code]
+        if len(chunks) > 1:
+            chunks[:] = [np.concatenate(chunks)]   # sklejenie porcji przy odczycie
+        return chunks[0] if chunks else np.empty(0, dtype=np.int64)
+
+    def results_for(self, name: str) -> pd.DataFrame:
+        """Wszystkie wyniki zawodnika (kolejność dopisywania)."""
+        return self._frame(self._group_rows(self._rows_by_name, self._name_code[name]))
+
+    def results_for_race(self, race: str) -> pd.DataFrame:
+        """Wszystkie wyniki w kategorii biegu (kolejność dopisywania)."""
+        return self._frame(self._group_rows(self._rows_by_race, self._race_code[race]))
@@ -1,26 +1,100 @@
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+from utils.io import read_table, is_columnar
+
+# Klient i kategoria jako category: kody int zamiast stringów -> agregacja przez np.bincount
+SALES_DTYPES = {"order_id": "object", "customer": "category", "category": "category", "amount": "float64"}
+SALES_PARSE_DATES = ["order_date"]
+AGG_COLUMNS = ["order_id", "customer", "category", "amount"]
+
+
+def _per_code(codes: np.ndarray, n_codes: int, weights: np.ndarray = None) -> np.ndarray:
+    # jeden przebieg po kodach; kod -1 (brak wartości) pomijany jak w groupby
+    valid = codes >= 0
+    return np.bincount(codes[valid], weights=None if weights is None else weights[valid], minlength=n_codes)
+
+
 def solve_sales(csv_path: Path) -> dict:
-    sales = pd.read_csv(csv_path, parse_dates=["order_date"])
-    electronics_only = sales[sales["category"] == "electronics"].copy()
-    sales["amount_with_vat"] = (sales["amount"] * 1.23).round(2)
+    if is_columnar(csv_path):
+        # Parquet/Feather: agregaty tylko z potrzebnych kolumn, elektronika przez filtr
+        # (w Parquet posortowanym po kategorii czytane są tylko jej grupy wierszy)
+        sales = read_table(csv_path, columns=AGG_COLUMNS, dtype=SALES_DTYPES)
+        electronics_only = read_table(csv_path, filters=[("category", "==", "electronics")], dtype=SALES_DTYPES)
+    else:
+        sales = read_table(csv_path, dtype=SALES_DTYPES, parse_dates=SALES_PARSE_DATES)
+        electronics_only = sales[sales["category"] == "electronics"].copy()
+    category = sales["category"]
+    customer = sales["customer"]
+
+    amount = np.nan_to_num(sales["amount"].to_numpy(), nan=0.0)
+    has_order = sales["order_id"].notna().to_numpy()
+    customer_codes = customer.cat.codes.to_numpy()
+    category_codes = category.cat.codes.to_numpy()
+
     total_sales_per_customer = (
-        sales.groupby("customer", as_index=False)["amount"]
-        .sum()
-        .rename(columns={"amount":"total_sales"})
+        pd.DataFrame({
+            "customer": customer.cat.categories.to_numpy(),
+            "total_sales": _per_code(customer_codes, len(customer.cat.categories), amount),
+        })
         .sort_values("total_sales", ascending=False)
     )
     orders_per_category = (
-        sales.groupby("category", as_index=False)["order_id"]
-        .count()
-        .rename(columns={"order_id":"orders_count"})
+        pd.DataFrame({
+            "category": category.cat.categories.to_numpy(),
+            "orders_count": _per_code(category_codes[has_order], len(category.cat.categories)),
+        })
         .sort_values("orders_count", ascending=False)
     )
-    top3_customers = total_sales_per_customer.head(3).copy()
+    top3_customers = total_sales_per_customer.nlargest(3, "total_sales")
     return {
         "electronics_only": electronics_only,
         "total_sales_per_customer": total_sales_per_customer,
         "orders_per_category": orders_per_category,
         "top3_customers": top3_customers
     }
+
+
+def solve_sales_chunked(csv_path: Path, electronics_path: Path = None, chunksize: int = 1_000_000) -> dict:
+    """
+    Wersja strumieniowa dla plików większych niż RAM: read_csv porcjami po chunksize wierszy,
+    częściowe sumy/liczniki scalane między porcjami. Te same klucze wyniku, ale
+    "electronics_only" to ścieżka do CSV dopisywanego porcjami (albo None, gdy electronics_path=None).
+    Daty nie są parsowane - w tym zadaniu nie są potrzebne, a do pliku trafiają bez zmian.
+    """
+    usecols = ["order_id", "customer", "category", "amount"]
+    if electronics_path is not None:
+        usecols = None  # pełne wiersze elektroniki trafiają do pliku
+        Path(electronics_path).unlink(missing_ok=True)
+
+    totals = pd.Series(dtype="float64")
+    counts = pd.Series(dtype="int64")
+    header = True
+    for chunk in pd.read_csv(csv_path, usecols=usecols, dtype=SALES_DTYPES, chunksize=chunksize):
+        part_totals = chunk["amount"].fillna(0.0).groupby(chunk["customer"], observed=True).sum()
+        part_counts = chunk["order_id"].groupby(chunk["category"], observed=True).count()
+        # kategorie różnią się między porcjami - scalanie po etykietach
+        totals = totals.add(part_totals.rename(index=str), fill_value=0.0)
+        counts = counts.add(part_counts.rename(index=str), fill_value=0).astype("int64")
+
+        if electronics_path is not None:
+            chunk[chunk["category"] == "electronics"].to_csv(
+                electronics_path, index=False, header=header, mode="a"
+            )
+            header = False
+
+    total_sales_per_customer = (
+        totals.rename_axis("customer").reset_index(name="total_sales")
+        .sort_values("total_sales", ascending=False)
+    )
+    orders_per_category = (
+        counts.rename_axis("category").reset_index(name="orders_count")
+        .sort_values("orders_count", ascending=False)
+    )
+    return {
+        "electronics_only": electronics_path,
+        "total_sales_per_customer": total_sales_per_customer,
+        "orders_per_category": orders_per_category,
+        "top3_customers": total_sales_per_customer.nlargest(3, "total_sales")
+    }
@@ -2,26 +2,123 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from utils.binary_cache import load_column
+from utils.io import read_table, is_columnar
+
+BEST_K = 5
+
+
+def fused_stats(arr: np.ndarray, k: int = BEST_K) -> tuple:
+    """
+    Statystyki bez pełnego sortowania: średnia i odchylenia z jednego przebiegu (odchylenia
+    są potem ponownie użyte jako z-score), a mediana, min, max i k najlepszych z jednego
+    np.argpartition. Zwraca (summary, z_scores, best_indices).
+    """
+    n = arr.size
+    mean_time = float(arr.sum() / n)
+    dev = arr - mean_time
+    std_time = float(np.sqrt(np.dot(dev, dev) / n))
+
+    k = min(k, n)
+    mid = n // 2
+    kth = sorted({0, max(k - 1, 0), mid, n - 1} | ({mid - 1} if n % 2 == 0 else set()))
+    idx = np.argpartition(arr, kth)
+    median_time = float(arr[idx[mid]]) if n % 2 else float((arr[idx[mid - 1]] + arr[idx[mid]]) / 2)
+
+    best_indices = idx[:k][np.argsort(arr[idx[:k]], kind="stable")]
+    if std_time > 0:
+        dev /= std_time   # z-score w miejscu, bez nowej tablicy
+        z_scores = dev
+    else:
+        z_scores = np.zeros_like(arr)
+    summary = {
+        "mean": mean_time,
+        "median": median_time,
+        "min": float(arr[idx[0]]),
+        "max": float(arr[idx[n - 1]]),
+        "std": std_time
+    }
+    return summary, z_scores, best_indices
+
+
 def solve_times(csv_path: Path) -> dict:
-    df = pd.read_csv(csv_path)
-    arr = df["time_min"].to_numpy(dtype=float)
-    mean_time = float(np.mean(arr))
-    median_time = float(np.median(arr))
-    min_time = float(np.min(arr))
-    max_time = float(np.max(arr))
-    std_time = float(np.std(arr, ddof=0))
-    z_scores = (arr - mean_time) / std_time if std_time > 0 else np.zeros_like(arr)
-    best_indices = np.argsort(arr)[:5]
-    best_five = arr[best_indices]
+    if is_columnar(csv_path):
+        # z pliku kolumnowego czytana jest tylko kolumna time_min
+        arr = read_table(csv_path, columns=["time_min"])["time_min"].to_numpy(dtype=np.float64)
+    else:
+        # times_10k.time_min.npy obok CSV, mapowany z dysku (przebudowa, gdy CSV nowszy)
+        arr = load_column(csv_path, "time_min")
+    summary, z_scores, best_indices = fused_stats(arr)
+    z_scores = np.asarray(z_scores)
+    best_five = np.asarray(arr[best_indices])
     return {
-        "summary": {
-            "mean": mean_time,
-            "median": median_time,
-            "min": min_time,
-            "max": max_time,
-            "std": std_time
-        },
+        "summary": summary,
         "z_scores": z_scores,
         "best_five": best_five,
         "best_indices": best_indices
-    }
\ No newline at end of file
+    }
+
+
+def solve_times_streaming(csv_path: Path, chunksize: int = 1_000_000, sample_size: int = 100_000,
+                          seed: int = 0) -> dict:
+    """
+    Wersja dla danych większych niż RAM: czyta porcjami, scala momenty (wzór Chana),
+    min/max i k najlepszych między porcjami. Mediana jest przybliżona - liczona z losowej
+    próbki sample_size wartości (bottom-k po losowych kluczach, bez powtórzeń).
+    z_scores wymagałyby drugiego przebiegu, więc zwracane jest None.
+    """
+    rng = np.random.default_rng(seed)
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    lo, hi = np.inf, -np.inf
+    best_vals = np.empty(0)
+    best_idx = np.empty(0, dtype=np.int64)
+    sample_keys = np.empty(0)
+    sample_vals = np.empty(0)
+
+    for chunk in pd.read_csv(csv_path, usecols=["time_min"], dtype={"time_min": "float64"}, chunksize=chunksize):
+        arr = chunk["time_min"].to_numpy()
+        m = arr.size
+        if m == 0:
+            continue
+        # momenty porcji + scalenie z dotychczasowymi
+        c_mean = float(arr.mean())
+        c_dev = arr - c_mean
+        c_m2 = float(np.dot(c_dev, c_dev))
+        delta = c_mean - mean
+        total = n + m
+        mean += delta * m / total
+        m2 += c_m2 + delta * delta * n * m / total
+        lo, hi = min(lo, float(arr.min())), max(hi, float(arr.max()))
+
+        # k najlepszych: kandydaci z porcji + dotychczasowi
+        k = min(BEST_K, m)
+        part = np.argpartition(arr, k - 1)[:k]
+        cand_vals = np.concatenate([best_vals, arr[part]])
+        cand_idx = np.concatenate([best_idx, part + n])
+        keep = np.argsort(cand_vals, kind="stable")[:BEST_K]
+        best_vals, best_idx = cand_vals[keep], cand_idx[keep]
+
+        # próbka do kwantyli: sample_size wartości o najmniejszych losowych kluczach
+        keys = np.concatenate([sample_keys, rng.random(m)])
+        vals = np.concatenate([sample_vals, arr])
+        if keys.size > sample_size:
+            keep = np.argpartition(keys, sample_size - 1)[:sample_size]
+            keys, vals = keys[keep], vals[keep]
+        sample_keys, sample_vals = keys, vals
+        n = total
+
+    std_time = float(np.sqrt(m2 / n)) if n else float("nan")
+    return {
+        "summary": {
+            "mean": mean,
+            "median": float(np.median(sample_vals)) if n else float("nan"),
+            "min": lo,
+            "max": hi,
+            "std": std_time
+        },
+        "z_scores": None,
+        "best_five": best_vals,
+        "best_indices": best_idx
+    }
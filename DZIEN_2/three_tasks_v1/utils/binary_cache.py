@@ -0,0 +1,63 @@
+from pathlib import Path
+import os
+import numpy as np
+import pandas as pd
+
+
+def npy_path(csv_path: Path, column: str) -> Path:
+    # np. data/times_10k.csv -> data/times_10k.time_min.npy
+    csv_path = Path(csv_path)
+    return csv_path.with_name(f"{csv_path.stem}.{column}.npy")
+
+
+def is_fresh(csv_path: Path, npy: Path) -> bool:
+    """Plik binarny jest aktualny, jeśli istnieje i nie jest starszy niż CSV."""
+    return npy.exists() and npy.stat().st_mtime_ns >= Path(csv_path).stat().st_mtime_ns
+
+
+def convert_csv_column(csv_path: Path, column: str, dtype=np.float64, chunksize: int = 1_000_000) -> Path:
+    """
+    Zapisuje kolumnę CSV jako .npy obok pliku (porcjami, przez open_memmap; podmiana atomowa).
+    Liczba linii to tylko górne ograniczenie liczby wierszy (read_csv pomija puste linie, a pole
+    w cudzysłowie może zawierać nową linię) - plik jest przycinany do liczby wczytanych wierszy.
+    """
+    csv_path = Path(csv_path)
+    out = npy_path(csv_path, column)
+    with open(csv_path, "rb") as f:
+        max_rows = max(sum(1 for _ in f) - 1, 0)   # bez nagłówka
+
+    tmp = out.with_name(out.name + ".tmp")
+    arr = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=(max_rows,))
+    pos = 0
+    for chunk in pd.read_csv(csv_path, usecols=[column], dtype={column: dtype}, chunksize=chunksize):
+        values = chunk[column].to_numpy()
+        if pos + values.size > max_rows:
+            raise ValueError(f"{csv_path}: wczytano więcej wierszy niż linii w pliku ({max_rows})")
+        arr[pos:pos + values.size] = values
+        pos += values.size
+    arr.flush()
+    if pos != max_rows:
+        # kopia tylko wczytanych wierszy - bez zer z nadmiarowego końca
+        trimmed = tmp.with_name(tmp.name + ".trim.npy")
+        np.save(trimmed, arr[:pos])
+        del arr
+        os.replace(trimmed, tmp)
+    else:
+        del arr
+    os.replace(tmp, out)
+    return out
+
+
+def load_column(csv_path: Path, column: str, dtype=np.float64) -> np.ndarray:
+    """
+    Kolumna jako np.memmap z pliku .npy (tylko do odczytu, przez page cache) zamiast
+    parsowania CSV; plik binarny jest (prze)budowany, gdy go brak albo CSV jest nowszy.
+    """
+    npy = npy_path(csv_path, column)
+    if not is_fresh(csv_path, npy):
+        convert_csv_column(csv_path, column, dtype)
+    arr = np.load(npy, mmap_mode="r")
+    if arr.dtype != np.dtype(dtype):
+        convert_csv_column(csv_path, column, dtype)
+        arr = np.load(npy, mmap_mode="r")
+    return arr
@@ -0,0 +1,121 @@
+from pathlib import Path
+import ast
+import hashlib
+import inspect
+import os
+import pickle
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "output" / ".cache"
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def file_digest(path: Path, block: int = 2**20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(block):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _module_file(root: Path, module: str):
+    base = root.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def project_sources(func) -> list:
+    """
+    Pliki źródłowe modułu func i wszystkich modułów projektu, które importuje (rekurencyjnie,
+    z instrukcji import w kodzie). Moduły spoza katalogu projektu (pandas, numpy...) są pomijane.
+    """
+    src = Path(inspect.getsourcefile(func)).resolve()
+    root = src.parents[func.__module__.count(".")]   # katalog, z którego importowany jest pakiet
+    seen, stack = set(), [src]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                # "from utils import plotting" - moduł albo nazwa z modułu utils
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                found = _module_file(root, name)
+                if found is not None:
+                    stack.append(found.resolve())
+    return sorted(seen)
+
+
+def cache_key(func, args: tuple, kwargs: dict, inputs: tuple, code_files: tuple) -> str:
+    """Klucz = funkcja + wersja kodu (treść plików źródłowych) + treść plików wejściowych + argumenty."""
+    h = hashlib.sha256()
+    h.update(f"{func.__module__}.{func.__qualname__}".encode())
+    for src in (*project_sources(func), *code_files):
+        h.update(file_digest(src).encode())
+    for path in inputs:
+        h.update(file_digest(path).encode())
+    h.update(repr((args, sorted(kwargs.items()))).encode())
+    return h.hexdigest()
+
+
+def _evict(cache_dir: Path, max_bytes: int) -> None:
+    # LRU: mtime pliku odświeżany przy każdym trafieniu, usuwamy najdawniej używane
+    entries = sorted(cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime_ns)
+    total = sum(p.stat().st_size for p in entries)
+    for p in entries:
+        if total <= max_bytes:
+            break
+        total -= p.stat().st_size
+        p.unlink(missing_ok=True)
+
+
+def _restore(path: Path, data: bytes) -> None:
+    # plik wynikowy (np. wykres) z wpisu cache, jeśli na dysku go brak albo pochodzi z innego wywołania
+    path = Path(path)
+    if path.exists() and path.read_bytes() == data:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def cached_call(func, *args, inputs: tuple = (), outputs: tuple = (), code_files: tuple = (),
+                cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES, **kwargs):
+    """
+    func(*args, **kwargs) z wynikiem w cache na dysku (pickle). Wynik jest liczony ponownie, gdy
+    zmieni się treść plików inputs, kod func i importowanych przez nią modułów projektu
+    (plus code_files) albo argumenty. Pliki outputs (np. wykres) są zapisywane we wpisie razem
+    z wynikiem i odtwarzane przy trafieniu, więc na dysku zawsze odpowiadają zwróconemu wynikowi.
+    Katalog cache ma limit max_bytes z usuwaniem najdawniej używanych wpisów.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry = cache_dir / f"{cache_key(func, args, kwargs, inputs, code_files)}.pkl"
+
+    if entry.exists():
+        try:
+            with open(entry, "rb") as f:
+                cached = pickle.load(f)
+            for path in outputs:
+                _restore(path, cached["outputs"][str(path)])
+            os.utime(entry)
+            return cached["result"]
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+            entry.unlink(missing_ok=True)
+
+    result = func(*args, **kwargs)
+    cached = {"result": result, "outputs": {str(path): Path(path).read_bytes() for path in outputs}}
+    tmp = entry.with_name(entry.name + f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, entry)
+    _evict(cache_dir, max_bytes)
+    return result
@@ -0,0 +1,83 @@
+from pathlib import Path
+import operator
+import pandas as pd
+
+from utils.binary_cache import is_fresh
+
+# Formaty kolumnowe (wymagają pyarrow); pozostałe pliki czytane jako CSV
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+FEATHER_SUFFIXES = {".feather", ".arrow"}
+ROW_GROUP_SIZE = 100_000
+
+_OPS = {
+    "==": operator.eq, "=": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "in": lambda s, v: s.isin(v), "not in": lambda s, v: ~s.isin(v),
+}
+
+
+def is_columnar(path: Path) -> bool:
+    return Path(path).suffix.lower() in PARQUET_SUFFIXES | FEATHER_SUFFIXES
+
+
+def _apply_filters(df: pd.DataFrame, filters: list) -> pd.DataFrame:
+    # filtry w formacie pyarrow: lista (kolumna, operator, wartość) łączona przez AND
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        mask &= _OPS[op](df[column], value)
+    return df[mask]
+
+
+def read_table(path: Path, columns: list = None, filters: list = None, dtype: dict = None,
+               parse_dates: list = None) -> pd.DataFrame:
+    """
+    Wczytuje CSV, Parquet albo Feather (wybór po rozszerzeniu) do DataFrame o tych samych typach.
+    columns - tylko wskazane kolumny (w Parquet/Feather pozostałe nie są w ogóle czytane);
+    filters - lista (kolumna, op, wartość), np. [("category", "==", "electronics")]; w Parquet
+    pomijane są całe grupy wierszy na podstawie statystyk min/max, w CSV/Feather filtr po wczytaniu.
+    parse_dates dotyczy tylko CSV (w plikach kolumnowych daty są zapisane jako timestamp);
+    dtype w plikach kolumnowych ujednolica typy z CSV (np. tekst jako object, nie string[pyarrow]).
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in PARQUET_SUFFIXES | FEATHER_SUFFIXES:
+        if suffix in PARQUET_SUFFIXES:
+            df = pd.read_parquet(path, columns=columns, filters=filters or None)
+            filters = None   # już zastosowane przy odczycie
+        else:
+            df = pd.read_feather(path, columns=columns)
+        df = df.astype({c: t for c, t in (dtype or {}).items() if c in df.columns})
+    else:
+        dtype = {c: t for c, t in (dtype or {}).items() if columns is None or c in columns}
+        parse_dates = [c for c in (parse_dates or []) if columns is None or c in columns]
+        df = pd.read_csv(path, usecols=columns, dtype=dtype or None, parse_dates=parse_dates or None)
+    return _apply_filters(df, filters).reset_index(drop=True) if filters else df
+
+
+def columnar_path(csv_path: Path, fmt: str = "parquet") -> Path:
+    # np. data/sales.csv -> data/sales.parquet
+    return Path(csv_path).with_suffix(f".{fmt}")
+
+
+def convert_csv(csv_path: Path, fmt: str = "parquet", dtype: dict = None, parse_dates: list = None,
+                sort_by: list = None, row_group_size: int = ROW_GROUP_SIZE) -> Path:
+    """
+    Zapisuje CSV jako Parquet/Feather obok pliku (typy z dtype/parse_dates zachowane w pliku,
+    category jako kolumny słownikowe). sort_by układa wiersze tak, by filtr po tej kolumnie
+    trafiał w niewiele grup wierszy. Plik nie jest przebudowywany, jeśli jest nowszy niż CSV.
+    """
+    out = columnar_path(csv_path, fmt)
+    if is_fresh(csv_path, out):
+        return out
+    df = pd.read_csv(csv_path, dtype=dtype, parse_dates=parse_dates)
+    if sort_by:
+        df = df.sort_values(sort_by, kind="stable", ignore_index=True)
+    tmp = out.with_name(out.name + ".tmp")
+    if fmt == "parquet":
+        df.to_parquet(tmp, index=False, row_group_size=row_group_size)
+    elif fmt == "feather":
+        df.to_feather(tmp)
+    else:
+        raise ValueError(f"Nieznany format: {fmt!r} (dozwolone: parquet, feather)")
+    tmp.replace(out)
+    return out
@@ -1,23 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import matplotlib.pyplot as plt
+import threading
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 
-def bar_mean_times(mean_times_by_race:pd.DataFrame, out_path:Path, add_labels:bool=True):
+# Próg średniego czasu [min] dla kategorii biegu: poniżej -> zielony, pozostałe -> szary
+THRESHOLDS = {"10K": 55, "Half": 125}
+FIGSIZE = (6.4, 4.8)
+DPI = 100
+
+_local = threading.local()
+
+
+def bar_colors(mean_times_by_race: pd.DataFrame, thresholds: dict = THRESHOLDS) -> np.ndarray:
+    thr = mean_times_by_race["race"].map(thresholds).fillna(np.inf).to_numpy(dtype=float)
+    return np.where(mean_times_by_race["time_min"].to_numpy() < thr, "green", "gray")
+
+
+def _template():
+    # jedna figura na wątek/proces, czyszczona między wykresami zamiast tworzenia nowej
+    fig = getattr(_local, "fig", None)
+    if fig is None:
+        fig = Figure(figsize=FIGSIZE, dpi=DPI)
+        FigureCanvasAgg(fig)
+        fig.add_subplot()
+        fig.subplots_adjust(left=0.12, right=0.97, bottom=0.11, top=0.93)
+        _local.fig = fig
+    return fig
+
+
+def bar_mean_times(mean_times_by_race: pd.DataFrame, out_path: Path, add_labels: bool = True):
     # Wykres słupkowy (kolory opcjonalne — można usunąć jeśli niepożądane)
-    thresholds = {"10K": 55, "Half": 125}
-    colors = []
-    for _, row in mean_times_by_race.iterrows():
-        thr = thresholds.get(row["race"], np.inf)
-        colors.append("green" if row["time_min"] < thr else "gray")
-
-    plt.figure()
-    plt.bar(mean_times_by_race["race"], mean_times_by_race["time_min"], color=colors)
-    plt.title("Średnie czasy wg kategorii biegu")
-    plt.xlabel("Kategoria biegu")
-    plt.ylabel("Średni czas [min]")
-    for i, v in enumerate(mean_times_by_race["time_min"]):
-        plt.text(i, v + 1, f"{v:.1f}", ha="center", va="bottom")
-    plt.tight_layout()
-    plt.savefig(plot_path)
-    plt.close()
+    fig = _template()
+    ax = fig.axes[0]
+    ax.cla()
+    times = mean_times_by_race["time_min"].to_numpy()
+    bars = ax.bar(mean_times_by_race["race"].astype(str), times, color=bar_colors(mean_times_by_race))
+    ax.set_title("Średnie czasy wg kategorii biegu")
+    ax.set_xlabel("Kategoria biegu")
+    ax.set_ylabel("Średni czas [min]")
+    if add_labels:
+        ax.bar_label(bars, labels=[f"{v:.1f}" for v in times], padding=2)
+    fig.savefig(out_path)
+    return out_path
+
+
+def _render_job(job: tuple) -> Path:
+    mean_times_by_race, out_path, *rest = job
+    return bar_mean_times(mean_times_by_race, out_path, *rest)
+
+
+def render_many(jobs, max_workers: int = None, chunksize: int = 8) -> list:
+    """
+    Wsadowe renderowanie wielu wykresów: jobs to krotki (mean_times_by_race, out_path[, add_labels]).
+    Każdy proces puli używa własnej figury-szablonu. Zwraca listę ścieżek w kolejności jobs.
+    """
+    jobs = list(jobs)
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_render_job, jobs, chunksize=chunksize))
@@ -0,0 +1,94 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Callable
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class Task:
+    name: str
+    func: Callable          # funkcja z poziomu modułu (musi dać się zapiklować)
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    deps: tuple = ()        # nazwy zadań, które muszą skończyć się wcześniej
+
+
+def _peak_rss_mib():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KiB, macOS: bajty
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _run_measured(func: Callable, args: tuple, kwargs: dict):
+    # pamięć mierzona w procesie zadania: przyrost szczytowego RSS w trakcie wywołania
+    rss0 = _peak_rss_mib()
+    t0 = time.perf_counter()
+    result = func(*args, **kwargs)
+    wall_s = time.perf_counter() - t0
+    growth = None if rss0 is None else _peak_rss_mib() - rss0
+    return result, {"wall_s": wall_s, "rss_growth_mib": growth}
+
+
+def _check_graph(tasks: list) -> None:
+    names = {t.name for t in tasks}
+    if len(names) != len(tasks):
+        raise ValueError("Powtórzone nazwy zadań")
+    for t in tasks:
+        missing = set(t.deps) - names
+        if missing:
+            raise ValueError(f"Zadanie {t.name!r}: nieznane zależności {sorted(missing)}")
+    # wykrywanie cykli: kolejne "warstwy" zadań bez niespełnionych zależności
+    done, pending = set(), {t.name: set(t.deps) for t in tasks}
+    while pending:
+        ready = [name for name, deps in pending.items() if deps <= done]
+        if not ready:
+            raise ValueError(f"Cykl w zależnościach: {sorted(pending)}")
+        for name in ready:
+            done.add(name)
+            del pending[name]
+
+
+def run_tasks(tasks: list, max_workers: int = None) -> tuple:
+    """
+    Uruchamia niezależne zadania równolegle w puli procesów, z zachowaniem kolejności z deps.
+    Procesy puli są używane ponownie (bez ponownego importu pandas/matplotlib na zadanie);
+    pula powstaje dopiero, gdy naraz gotowe są co najmniej dwa zadania - pojedyncze zadanie,
+    max_workers=1 albo jeden CPU -> wykonanie w bieżącym procesie.
+    Zwraca (wyniki: {nazwa: wynik}, statystyki: {nazwa: {"wall_s", "rss_growth_mib"}}).
+    """
+    _check_graph(tasks)
+    workers = max_workers or os.cpu_count() or 1
+    results, stats = {}, {}
+    waiting = {t.name: t for t in tasks}
+    running = {}
+    pool = None
+    try:
+        while waiting or running:
+            ready = [t for t in waiting.values() if set(t.deps) <= results.keys()]
+            for task in ready:
+                del waiting[task.name]
+            if workers == 1 or (not running and len(ready) <= 1):
+                for task in ready:
+                    results[task.name], stats[task.name] = _run_measured(task.func, task.args, task.kwargs)
+                continue
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=workers)
+            for task in ready:
+                running[pool.submit(_run_measured, task.func, task.args, task.kwargs)] = task.name
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                results[name], stats[name] = future.result()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results, stats
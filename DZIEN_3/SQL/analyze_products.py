@@ -2,8 +2,9 @@ import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from scipy import stats
+from db_backend import get_backend_engine
 
 # ==============================
 # 1. KONFIGURACJA POŁĄCZENIA
@@ -16,7 +17,7 @@ MYSQL_DB   = os.getenv("MYSQL_DB",   "demo_db")
 TABLE_NAME = "products_demo"
 
 DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASS}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
-engine = create_engine(DATABASE_URL)
+engine = get_backend_engine(DATABASE_URL)   # DB_BACKEND=sqlite -> lokalny plik SQLite
 
 # ==============================
 # 2. ODCZYT TABELI DO PANDAS
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Masowy zapis wierszy przez mysql.connector (np. nocny import studentów, 10^6 wierszy).
+- kursor prepared (server-side prepared statements)
+- executemany zamieniony na wielowierszowe INSERT ... VALUES (...),(...) po batch_size wierszy
+- ponawianie porcji po deadlocku / lock wait timeout (commit po każdej porcji)
+- raport przepustowości (wiersze/s)
+"""
+
+from __future__ import annotations
+import configparser
+import time
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Sequence
+
+DEADLOCK_ERRNOS = {1213, 1205}   # ER_LOCK_DEADLOCK, ER_LOCK_WAIT_TIMEOUT
+MAX_PLACEHOLDERS = 65_535        # limit parametrów jednego prepared statement w MySQL
+
+
+@lru_cache(maxsize=None)
+def load_mysql_config(path: str = "config.ini", section: str = "mysql") -> dict:
+    """Parametry połączenia z pliku ini - czytane raz na proces."""
+    config = configparser.ConfigParser()
+    if not config.read(path):
+        raise FileNotFoundError(path)
+    cfg = config[section]
+    return {
+        "user": cfg["user"],
+        "password": cfg["password"],
+        "host": cfg["host"],
+        "port": int(cfg["port"]),
+        "database": cfg["database"],
+    }
+
+
+class BatchWriter:
+    def __init__(self, connection, table: str, columns: Sequence[str], batch_size: int = 1000,
+                 max_retries: int = 3, retry_delay_s: float = 0.2, prepared: bool = True):
+        self.connection = connection
+        self.table = table
+        self.columns = tuple(columns)
+        # batch_size * liczba kolumn nie może przekroczyć limitu placeholderów
+        self.batch_size = max(1, min(batch_size, MAX_PLACEHOLDERS // len(self.columns)))
+        self.max_retries = max_retries
+        self.retry_delay_s = retry_delay_s
+        self.prepared = prepared
+        self._sql_cache: dict[int, str] = {}
+        self.rows = 0
+        self.batches = 0
+        self.retries = 0
+        self.seconds = 0.0
+
+    def _sql(self, n_rows: int) -> str:
+        # w praktyce tylko dwa warianty: pełna porcja i ostatnia, krótsza
+        sql = self._sql_cache.get(n_rows)
+        if sql is None:
+            row = "(" + ",".join(["%s"] * len(self.columns)) + ")"
+            sql = (f"INSERT INTO {self.table}({','.join(self.columns)}) VALUES "
+                   + ",".join([row] * n_rows))
+            self._sql_cache[n_rows] = sql
+        return sql
+
+    def _execute_batch(self, cursor, batch: list) -> None:
+        from mysql.connector import errors
+
+        params = [value for row in batch for value in row]
+        sql = self._sql(len(batch))
+        for attempt in range(self.max_retries + 1):
+            try:
+                cursor.execute(sql, params)
+                self.connection.commit()
+                return
+            except errors.DatabaseError as exc:
+                self.connection.rollback()
+                if exc.errno not in DEADLOCK_ERRNOS or attempt == self.max_retries:
+                    raise
+                self.retries += 1
+                time.sleep(self.retry_delay_s * 2 ** attempt)
+
+    def write(self, rows: Iterable[Sequence]) -> dict:
+        """Zapisuje wszystkie wiersze porcjami; zwraca statystyki łączne dla tego writera."""
+        cursor = self.connection.cursor(prepared=self.prepared)
+        rows = iter(rows)
+        t0 = time.perf_counter()
+        try:
+            while batch := list(islice(rows, self.batch_size)):
+                self._execute_batch(cursor, batch)
+                self.rows += len(batch)
+                self.batches += 1
+        finally:
+            cursor.close()
+            self.seconds += time.perf_counter() - t0
+        return self.stats()
+
+    def stats(self) -> dict:
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "retries": self.retries,
+            "seconds": round(self.seconds, 3),
+            "rows_per_s": round(self.rows / self.seconds) if self.seconds else 0,
+        }
@@ -1,6 +1,6 @@
-import mysql.connector
+from db_engine import get_mysql_pool
 
-db = mysql.connector.connect(user='root', password='abc123', host='127.0.0.1', port=3306)
+db = get_mysql_pool(user='root', password='abc123', host='127.0.0.1', port=3306).get_connection()
 
 cursorObject = db.cursor()
 cursorObject.execute("CREATE DATABASE bazatestowa")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Wybór backendu bazy przez zmienne środowiskowe: MySQL (domyślnie) albo lokalny SQLite.
+- DB_BACKEND=mysql|sqlite
+- SQLITE_PATH=plik.sqlite albo :memory: (domyślnie demo.sqlite w bieżącym katalogu)
+
+Pozwala uruchomić skrypty z DZIEN_3/SQL bez serwera MySQL. Różnice dialektów:
+- ALTER TABLE ... ADD PRIMARY KEY (SQLite: przebudowa tabeli)
+"""
+
+from __future__ import annotations
+import os
+from pathlib import Path
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from db_engine import get_engine
+
+
+def backend_name() -> str:
+    name = os.getenv("DB_BACKEND", "mysql").lower()
+    if name not in ("mysql", "sqlite"):
+        raise ValueError(f"Nieznany DB_BACKEND: {name!r} (dozwolone: mysql, sqlite)")
+    return name
+
+
+def database_url(mysql_url: str) -> str:
+    """URL skryptu dla MySQL albo URL SQLite, gdy DB_BACKEND=sqlite."""
+    if backend_name() == "mysql":
+        return mysql_url
+    path = os.getenv("SQLITE_PATH", "demo.sqlite")
+    return "sqlite://" if path == ":memory:" else f"sqlite:///{Path(path).resolve()}"
+
+
+def get_backend_engine(mysql_url: str, **overrides) -> Engine:
+    """get_engine() dla wybranego backendu; SQLite w pamięci dostaje jedno współdzielone połączenie."""
+    url = database_url(mysql_url)
+    if url == "sqlite://":
+        overrides = {"poolclass": StaticPool, "connect_args": {"check_same_thread": False},
+                     **overrides}
+    return get_engine(url, **overrides)
+
+
+# ------------------------
+# RÓŻNICE DIALEKTÓW
+# ------------------------
+def add_primary_key(conn, table: str, column: str) -> None:
+    """ALTER TABLE ... ADD PRIMARY KEY; SQLite tego nie umie - tabela jest przebudowywana."""
+    if conn.dialect.name != "sqlite":
+        conn.execute(text(f"ALTER TABLE {table} ADD PRIMARY KEY ({column})"))
+        return
+
+    info = conn.execute(text(f"PRAGMA table_info({table})")).all()
+    columns = ", ".join(f'"{row.name}" {row.type}'.rstrip() for row in info)
+    conn.execute(text(f"CREATE TABLE {table}__pk ({columns}, PRIMARY KEY ({column}))"))
+    conn.execute(text(f"INSERT INTO {table}__pk SELECT * FROM {table}"))
+    conn.execute(text(f"DROP TABLE {table}"))
+    conn.execute(text(f"ALTER TABLE {table}__pk RENAME TO {table}"))
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Wspólna fabryka silników SQLAlchemy i pul połączeń mysql.connector.
+- jeden silnik na URL (współdzielony przez skrypty, zamiast create_engine w każdym)
+- QueuePool z rozmiarami z env, pre-ping, recycle i większym cache skompilowanych zapytań
+- metryki puli: checkouty, overflow, czas oczekiwania na połączenie, timeouty
+
+Strojenie pul przez zmienne środowiskowe:
+  DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_QUERY_CACHE_SIZE
+"""
+
+from __future__ import annotations
+import os
+import threading
+import time
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))  # domyślnie w SQLAlchemy: 500
+
+
+def mysql_url(user: str, password: str, host: str, port: int, database: str = "",
+              driver: str = "pymysql") -> str:
+    return f"mysql+{driver}://{user}:{password}@{host}:{port}/{database}"
+
+
+# ------------------------
+# 1) METRYKI PULI
+# ------------------------
+class PoolMetrics:
+    """Liczniki zdarzeń puli - podstawa do doboru pool_size/max_overflow dla równoległych raportów."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.connects = 0         # nowe fizyczne połączenia
+        self.checkouts = 0        # pobrania połączenia z puli
+        self.in_use = 0
+        self.in_use_peak = 0
+        self.overflow_peak = 0    # ile połączeń ponad pool_size naraz
+        self.waits = 0
+        self.wait_total_s = 0.0
+        self.wait_max_s = 0.0
+        self.timeouts = 0
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_connect(self, dbapi_conn, record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_conn, record, proxy):
+        overflow = self.engine.pool.overflow() if isinstance(self.engine.pool, QueuePool) else 0
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.in_use_peak = max(self.in_use_peak, self.in_use)
+            self.overflow_peak = max(self.overflow_peak, overflow)
+
+    def _on_checkin(self, dbapi_conn, record):
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_total_s += seconds
+            self.wait_max_s = max(self.wait_max_s, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "in_use": self.in_use,
+                "in_use_peak": self.in_use_peak,
+                "overflow_peak": self.overflow_peak,
+                "wait_avg_ms": 1000 * self.wait_total_s / self.waits if self.waits else 0.0,
+                "wait_max_ms": 1000 * self.wait_max_s,
+                "timeouts": self.timeouts,
+                "pool": self.engine.pool.status(),
+            }
+
+
+# ------------------------
+# 2) FABRYKA SILNIKÓW
+# ------------------------
+_engines: dict[tuple, Engine] = {}
+_metrics: dict[Engine, PoolMetrics] = {}
+_lock = threading.Lock()
+
+
+def get_engine(url: str, **overrides) -> Engine:
+    """Zwraca współdzielony silnik dla URL (tworzy go przy pierwszym wywołaniu)."""
+    key = (url, tuple(sorted((k, repr(v)) for k, v in overrides.items())))
+    with _lock:
+        engine = _engines.get(key)
+        if engine is None:
+            options = dict(
+                poolclass=QueuePool,
+                pool_size=POOL_SIZE,
+                max_overflow=MAX_OVERFLOW,
+                pool_timeout=POOL_TIMEOUT,
+                pool_recycle=POOL_RECYCLE,   # odświeżanie dłuższych połączeń
+                pool_pre_ping=True,          # zdrowie połączeń przed użyciem
+                query_cache_size=QUERY_CACHE_SIZE,
+                echo=False,
+            )
+            options.update(overrides)
+            if options["poolclass"] is not QueuePool:
+                # pule bez kolejki (StaticPool, NullPool) nie przyjmują rozmiarów
+                for name in ("pool_size", "max_overflow", "pool_timeout"):
+                    options.pop(name)
+            engine = create_engine(url, **options)
+            _engines[key] = engine
+            _metrics[engine] = PoolMetrics(engine)
+        return engine
+
+
+def pool_metrics(engine: Engine) -> PoolMetrics:
+    return _metrics[engine]
+
+
+@contextmanager
+def connection(engine: Engine, begin: bool = False):
+    """Jak engine.connect()/engine.begin(), ale mierzy czas oczekiwania na połączenie z puli."""
+    metrics = _metrics.get(engine)
+    t0 = time.perf_counter()
+    try:
+        conn = engine.connect()
+    except PoolTimeoutError:
+        if metrics is not None:
+            with metrics._lock:
+                metrics.timeouts += 1
+        raise
+    if metrics is not None:
+        metrics.record_wait(time.perf_counter() - t0)
+    with conn:
+        if begin:
+            with conn.begin():
+                yield conn
+        else:
+            yield conn
+
+
+def dispose_all() -> None:
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _metrics.clear()
+
+
+# ------------------------
+# 3) PULE DLA SUROWEGO mysql.connector
+# ------------------------
+_mysql_pools: dict[tuple, object] = {}
+
+
+def get_mysql_pool(pool_size: int = POOL_SIZE, **conn_kwargs):
+    """Współdzielona pula mysql.connector; connection.close() oddaje połączenie do puli."""
+    from mysql.connector import pooling
+
+    key = tuple(sorted(conn_kwargs.items()))
+    with _lock:
+        pool = _mysql_pools.get(key)
+        if pool is None:
+            pool = pooling.MySQLConnectionPool(
+                pool_name=f"pool{len(_mysql_pools)}",
+                pool_size=pool_size,
+                pool_reset_session=True,
+                **conn_kwargs,
+            )
+            _mysql_pools[key] = pool
+        return pool
@@ -1,24 +1,10 @@
-import configparser
-import mysql.connector
+from db_engine import get_mysql_pool
+from batch_writer import BatchWriter, load_mysql_config
 
-#ładowanie pliku konfiguracyjnego
-config = configparser.ConfigParser()
-config.read("config.ini")
+#ładowanie pliku konfiguracyjnego (sekcja [mysql], czytana raz na proces)
+db_config = load_mysql_config("config.ini")
 
-#pobranie danych z sekcji [mysql]
-db_user = config['mysql']['user']
-db_password = config['mysql']['password']
-db_host = config['mysql']['host']
-db_port = config['mysql']['port']
-db_database = config['mysql']['database']
-
-connection = mysql.connector.connect(
-    user = db_user,
-    password = db_password,
-    host = db_host,
-    port = db_port,
-    database = db_database
-)
+connection = get_mysql_pool(**db_config).get_connection()
 
 cursorObject = connection.cursor()
 tabela_student = """
@@ -30,15 +16,10 @@ studentid int primary key
 """
 
 cursorObject.execute(tabela_student)
-
-dodaj_studenta = """
-INSERT INTO student(firstname,lastname,studentid) values(%s,%s,%s);
-"""
-
-val_one = ("Jan","Kot",65435)
-cursorObject.execute(dodaj_studenta,val_one)
+cursorObject.close()
 
 valmulti = [
+    ("Jan","Kot",65435),
     ("Maria","Kos",75423),
     ("Tomasz","Kłos",65666),
     ("Marek","Kloss",213134),
@@ -48,7 +29,8 @@ valmulti = [
     ("Mira","Kopik",2313646)
 ]
 
-cursorObject.executemany(dodaj_studenta,valmulti)
+#wielowierszowe INSERT-y na kursorze prepared, z ponawianiem po deadlocku
+writer = BatchWriter(connection, "student", ("firstname", "lastname", "studentid"), batch_size=1000)
+print(writer.write(valmulti))
 
-connection.commit()
 connection.close()
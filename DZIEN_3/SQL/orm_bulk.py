@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Masowy zapis i strumieniowy odczyt użytkowników (model User z orm_models.py).
+- bulk_insert_users: insert(User) z listą słowników, porcjami, bez RETURNING
+- iter_users / iter_user_rows: odczyt z yield_per - bez materializacji wszystkich obiektów
+
+Benchmark (SQLite w pamięci, wiersze/s dla session.add vs ścieżki masowej):
+  python orm_bulk.py [liczba_wierszy]
+"""
+
+from __future__ import annotations
+import sys
+import time
+from itertools import islice
+from typing import Iterable, Iterator
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from orm_models import Base, User
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_YIELD_PER = 1_000
+
+
+def bulk_insert_users(session: Session, rows: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Wstawia słowniki {name, fullname, nickname} porcjami po batch_size (executemany, bez RETURNING)."""
+    stmt = insert(User)
+    rows = iter(rows)
+    total = 0
+    while batch := list(islice(rows, batch_size)):
+        session.execute(stmt, batch)
+        total += len(batch)
+    return total
+
+
+def bulk_insert_mappings(session: Session, rows: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Wariant ze starszym API Session.bulk_insert_mappings (return_defaults=False)."""
+    rows = iter(rows)
+    total = 0
+    while batch := list(islice(rows, batch_size)):
+        session.bulk_insert_mappings(User, batch, return_defaults=False)
+        total += len(batch)
+    return total
+
+
+def iter_users(session: Session, *criteria, yield_per: int = DEFAULT_YIELD_PER) -> Iterator[User]:
+    """Obiekty User pobierane porcjami po yield_per (kursor po stronie serwera, gdy sterownik pozwala)."""
+    stmt = select(User).where(*criteria).execution_options(yield_per=yield_per)
+    yield from session.scalars(stmt)
+
+
+def iter_user_rows(session: Session, *criteria, yield_per: int = DEFAULT_YIELD_PER) -> Iterator[tuple]:
+    """Same krotki (id, name, fullname, nickname) - najtańszy odczyt, bez obiektów ORM."""
+    stmt = (select(User.id, User.name, User.fullname, User.nickname)
+            .where(*criteria)
+            .execution_options(yield_per=yield_per))
+    for row in session.execute(stmt):
+        yield tuple(row)
+
+
+# ------------------------
+# BENCHMARK (SQLite)
+# ------------------------
+def _fake_users(n: int) -> Iterator[dict]:
+    for i in range(n):
+        yield {"name": f"name{i}", "fullname": f"full name {i}", "nickname": f"nick{i % 1000}"}
+
+
+def benchmark(n: int = 100_000, batch_size: int = DEFAULT_BATCH_SIZE) -> dict[str, float]:
+    """Wiersze/s dla: session.add po jednym, insert() z listą słowników, bulk_insert_mappings, odczytu yield_per."""
+    def timed(label, write):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            t0 = time.perf_counter()
+            write(session)
+            session.commit()
+            results[label] = n / (time.perf_counter() - t0)
+        return engine
+
+    results: dict[str, float] = {}
+    timed("session.add", lambda s: [s.add(User(**row)) for row in _fake_users(n)])
+    timed("bulk_insert_mappings", lambda s: bulk_insert_mappings(s, _fake_users(n), batch_size))
+    engine = timed("insert(User)", lambda s: bulk_insert_users(s, _fake_users(n), batch_size))
+
+    with Session(engine) as session:
+        t0 = time.perf_counter()
+        count = sum(1 for _ in iter_users(session))
+        results["read yield_per (ORM)"] = count / (time.perf_counter() - t0)
+    with Session(engine) as session:
+        t0 = time.perf_counter()
+        count = sum(1 for _ in iter_user_rows(session))
+        results["read yield_per (rows)"] = count / (time.perf_counter() - t0)
+
+    for label, rate in results.items():
+        print(f"{label:<24} {rate:>12,.0f} wierszy/s")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
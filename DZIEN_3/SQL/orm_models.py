@@ -0,0 +1,28 @@
+import sqlalchemy
+
+from sqlalchemy.orm import DeclarativeBase
+
+
+class Base(DeclarativeBase):
+    pass
+
+class User(Base):
+    __tablename__ = 'appusers'
+    # indeksy pomocnicze - nickname to najczęstszy filtr równościowy
+    __table_args__ = (
+        sqlalchemy.Index('ix_appusers_nickname', 'nickname'),
+    )
+    id = sqlalchemy.Column(sqlalchemy.Integer,primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String(length=50))
+    fullname = sqlalchemy.Column(sqlalchemy.String(length=50))
+    nickname = sqlalchemy.Column(sqlalchemy.String(length=50))
+
+    def __repr__(self):
+        return f'<User -> name: {self.name}, fullname: {self.fullname}, nickname: {self.nickname}>'
+
+
+def ensure_indexes(engine):
+    # create_all nie dokłada indeksów do istniejącej tabeli - robimy to osobno
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
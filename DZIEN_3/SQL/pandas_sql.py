@@ -1,5 +1,6 @@
 import pandas as pd
-from sqlalchemy import create_engine
+from db_engine import mysql_url
+from db_backend import get_backend_engine
 
 # Dane logowania do MySQL
 MYSQL_USER = "root"
@@ -9,9 +10,7 @@ MYSQL_PORT = 3306
 MYSQL_DB   = "bazatestowa"
 
 # Tworzymy silnik SQLAlchemy
-engine = create_engine(
-    f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASS}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
-)
+engine = get_backend_engine(mysql_url(MYSQL_USER, MYSQL_PASS, MYSQL_HOST, MYSQL_PORT, MYSQL_DB))
 
 # ----- ZAPIS -----
 # Tworzymy mały DataFrame
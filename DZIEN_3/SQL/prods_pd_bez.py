@@ -15,7 +15,8 @@ import math
 import time
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from db_backend import get_backend_engine, add_primary_key
 from sqlalchemy.types import (
     Integer, BigInteger, String, Float, DateTime
 )
@@ -45,12 +46,8 @@ DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASS}@{MYSQL_HOST}:{MYSQL_P
 #     conn.execute(text(f"CREATE DATABASE IF NOT EXISTS {MYSQL_DB} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"))
 
 # Silnik do docelowej bazy
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,      # połączenia - działają?nie?
-    pool_recycle=1800,       # odświeżanie dłuższych połączeń
-    echo=False               # ustaw True gdy chcesz log SQL
-)
+# (QueuePool, pool_pre_ping - połączenia działają?nie?, pool_recycle - patrz db_engine.py)
+engine = get_backend_engine(DATABASE_URL)
 
 # ------------------------
 # 2) GENERACJA DANYCH (5000 rekordów)
@@ -111,7 +108,7 @@ with engine.begin() as conn:
     )
 
     # Indeksy, które przydadzą się do analiz/filtrów
-    conn.execute(text(f"ALTER TABLE {table_name} ADD PRIMARY KEY (product_id)"))
+    add_primary_key(conn, table_name, "product_id")   # SQLite: przebudowa tabeli
     conn.execute(text(f"CREATE INDEX ix_{table_name}_category ON {table_name}(category)"))
     conn.execute(text(f"CREATE INDEX ix_{table_name}_ts ON {table_name}(ts)"))
     conn.execute(text(f"CREATE INDEX ix_{table_name}_country ON {table_name}(country)"))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Wektorowy generator danych syntetycznych dla tabeli products_demo.
+- kolumny tekstowe jako pd.Categorical (kody + słownik), bez stringów per wiersz
+- nazwy produktów jako kody do słownika "imię nazwisko" (iloczyn kartezjański)
+- generacja porcjami stałej wielkości, strumieniowana prosto do to_sql
+
+Pozwala zbudować tabelę 10M+ rekordów przy pamięci ograniczonej do jednej porcji.
+"""
+
+from __future__ import annotations
+from typing import Iterator
+import numpy as np
+import pandas as pd
+
+FIRST_NAMES = ["Aki", "Kai", "Ren", "Mika", "Sora", "Rin", "Kenta", "Yui", "Hana", "Taro"]
+LAST_NAMES = ["Tanaka", "Sato", "Suzuki", "Takahashi", "Kobayashi", "Watanabe", "Ito", "Yamamoto"]
+# słownik nazw: kod = i_imienia * len(LAST_NAMES) + i_nazwiska
+PRODUCT_NAMES = [f"{f} {l}" for f in FIRST_NAMES for l in LAST_NAMES]
+
+CATEGORIES = ["valves", "actuators", "seals", "sensors", "controllers"]
+CATEGORY_P = [0.35, 0.15, 0.2, 0.15, 0.15]
+COUNTRIES = ["PL", "DE", "CZ", "SK", "SE", "NO", "FR", "IT"]
+COUNTRY_P = [0.4, 0.12, 0.08, 0.07, 0.08, 0.05, 0.1, 0.1]
+
+DEFAULT_CHUNK_SIZE = 500_000
+
+
+def _codes(rng: np.random.Generator, k: int, n: int, p=None) -> np.ndarray:
+    # kody kategorii w najmniejszym typie całkowitym (int8 dla małych słowników)
+    dtype = np.int8 if k < 128 else np.int16
+    return rng.choice(k, size=n, p=p).astype(dtype)
+
+
+def generate_chunk(rng: np.random.Generator, start_id: int, n: int,
+                   today: np.datetime64 | None = None) -> pd.DataFrame:
+    """Jedna porcja n rekordów z product_id od start_id."""
+    today = np.datetime64("today", "D") if today is None else today
+    name_codes = (rng.integers(0, len(FIRST_NAMES), n, dtype=np.int16) * len(LAST_NAMES)
+                  + rng.integers(0, len(LAST_NAMES), n, dtype=np.int16))
+    quantity = rng.integers(1, 500, size=n, dtype=np.int32)
+    # ceny ~ log-normal, zaokrąglone do 2 miejsc, minimum 5.00
+    unit_price = np.round(np.maximum(5.0, rng.lognormal(mean=3.0, sigma=0.5, size=n)), 2)
+    # losowy dzień z ostatnich 365 dni - arytmetyka datetime64 zamiast to_timedelta
+    ts = (today - rng.integers(0, 365, size=n).astype("timedelta64[D]")).astype("datetime64[s]")
+
+    return pd.DataFrame({
+        "product_id": np.arange(start_id, start_id + n, dtype=np.int64),
+        "product_name": pd.Categorical.from_codes(name_codes, categories=PRODUCT_NAMES),
+        "category": pd.Categorical.from_codes(_codes(rng, len(CATEGORIES), n, CATEGORY_P), categories=CATEGORIES),
+        "quantity": quantity,
+        "unit_price": unit_price,
+        "revenue_est": np.round(quantity * unit_price, 2),
+        "ts": ts,
+        "country": pd.Categorical.from_codes(_codes(rng, len(COUNTRIES), n, COUNTRY_P), categories=COUNTRIES),
+    })
+
+
+def iter_products(n: int, chunk_size: int = DEFAULT_CHUNK_SIZE, seed: int = 42) -> Iterator[pd.DataFrame]:
+    """Strumień porcji po chunk_size rekordów (ostatnia może być krótsza); jeden RNG -> powtarzalność."""
+    rng = np.random.default_rng(seed)
+    today = np.datetime64("today", "D")
+    for start in range(0, n, chunk_size):
+        yield generate_chunk(rng, start + 1, min(chunk_size, n - start), today)
+
+
+def generate_products(n: int, seed: int = 42) -> pd.DataFrame:
+    """Cała tabela w pamięci - wygodne dla małych n (demo 5000 rekordów)."""
+    return generate_chunk(np.random.default_rng(seed), 1, n)
+
+
+def load_chunks(conn, table_name: str, chunks, dtype_map: dict | None = None,
+                if_exists: str = "replace", sql_chunksize: int = 1000) -> int:
+    """Zapisuje kolejne porcje przez to_sql: pierwsza wg if_exists, następne dopisywane. Zwraca liczbę wierszy."""
+    total = 0
+    for i, chunk in enumerate(chunks):
+        chunk.to_sql(
+            table_name,
+            conn,
+            if_exists=if_exists if i == 0 else "append",
+            index=False,
+            dtype=dtype_map,
+            chunksize=sql_chunksize,
+            method="multi",
+        )
+        total += len(chunk)
+    return total
@@ -1,24 +1,28 @@
 #!/usr/bin/env python3
 """
 Demo: Pandas + SQLAlchemy + MySQL
-- generuje DataFrame (5000 rekordów)
+- generuje dane porcjami (domyślnie 5000 rekordów, patrz product_generator.py)
 - zapisuje do MySQL jako tabelę
 - pokazuje odczyt i proste zapytania
 
 Ustaw zmienne środowiskowe lub wypełnij stałe poniżej:
   MYSQL_USER, MYSQL_PASS, MYSQL_HOST, MYSQL_PORT, MYSQL_DB
+Bez serwera MySQL: DB_BACKEND=sqlite [SQLITE_PATH=demo.sqlite] (patrz db_backend.py)
 """
 
 from __future__ import annotations
 import os
 import math
 import time
-import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.types import (
     Integer, BigInteger, String, Float, DateTime
 )
+from query_advisor import propose_indexes, create_indexes, report
+from product_generator import iter_products, load_chunks
+from db_engine import connection, pool_metrics
+from db_backend import get_backend_engine, add_primary_key
 
 # ------------------------
 # 1) KONFIGURACJA POŁĄCZENIA
@@ -38,42 +42,17 @@ DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASS}@{MYSQL_HOST}:{MYSQL_P
 # with server_engine.begin() as conn:
 #     conn.execute(text(f"CREATE DATABASE IF NOT EXISTS {MYSQL_DB} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"))
 
-# Silnik do docelowej bazy
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,      # zdrowie połączeń
-    pool_recycle=1800,       # odświeżanie dłuższych połączeń
-    echo=False               # ustaw True gdy chcesz log SQL
-)
+# Silnik do docelowej bazy (współdzielony: QueuePool, pre-ping, recycle - patrz db_engine.py)
+engine = get_backend_engine(DATABASE_URL)   # DB_BACKEND=sqlite -> lokalny plik SQLite
 
 # ------------------------
-# 2) GENERACJA DANYCH (5000 rekordów)
+# 2) GENERACJA DANYCH (domyślnie 5000 rekordów, PRODUCTS_N dla benchmarków 10M+)
 # ------------------------
-rng = np.random.default_rng(seed=42)
-N = 5000
-
-def random_names(n: int) -> list[str]:
-    first = np.array(["Aki", "Kai", "Ren", "Mika", "Sora", "Rin", "Kenta", "Yui", "Hana", "Taro"])
-    last  = np.array(["Tanaka", "Sato", "Suzuki", "Takahashi", "Kobayashi", "Watanabe", "Ito", "Yamamoto"])
-    return (rng.choice(first, n) + " " + rng.choice(last, n)).tolist()
-
-categories = ["valves", "actuators", "seals", "sensors", "controllers"]
-countries  = ["PL", "DE", "CZ", "SK", "SE", "NO", "FR", "IT"]
-
-df = pd.DataFrame({
-    "product_id": np.arange(1, N + 1, dtype=np.int64),
-    "product_name": random_names(N),
-    "category": rng.choice(categories, N, p=[0.35, 0.15, 0.2, 0.15, 0.15]),
-    "quantity": rng.integers(1, 500, size=N, dtype=np.int32),
-    # ceny ~ log-normal, zaokrąglone do 2 miejsc, minimum 5.00
-    "unit_price": np.round(np.maximum(5.0, rng.lognormal(mean=3.0, sigma=0.5, size=N)), 2),
-    # przychód = quantity * unit_price (dla wygody analizy)
-    "revenue_est": 0.0,  # uzupełnimy niżej
-    # losowy timestamp z ostatnich 365 dni
-    "ts": pd.to_datetime("now").normalize() - pd.to_timedelta(rng.integers(0, 365, size=N), unit="D"),
-    "country": rng.choice(countries, N, p=[0.4, 0.12, 0.08, 0.07, 0.08, 0.05, 0.1, 0.1])
-})
-df["revenue_est"] = (df["quantity"] * df["unit_price"]).round(2)
+N = int(os.getenv("PRODUCTS_N", "5000"))
+CHUNK_SIZE = int(os.getenv("PRODUCTS_CHUNK", "500000"))
+
+# Porcje z kolumnami kategorycznymi - generowane leniwie, w pamięci jest tylko jedna
+chunks = iter_products(N, chunk_size=CHUNK_SIZE, seed=42)
 
 # ------------------------
 # 3) ZAPIS DO MYSQL (to_sql)
@@ -93,36 +72,37 @@ dtype_map = {
 }
 
 # Tworzenie/odświeżenie tabeli (replace) i zapis chunkami
-with engine.begin() as conn:
-    df.to_sql(
-        table_name,
+with connection(engine, begin=True) as conn:
+    n_rows = load_chunks(
         conn,
+        table_name,
+        chunks,
+        dtype_map=dtype_map,
         if_exists="replace",
-        index=False,
-        dtype=dtype_map,
-        chunksize=1000,   # bezpieczne porcjowanie
-        method="multi"    # szybszy insert
+        sql_chunksize=1000   # bezpieczne porcjowanie INSERT ... VALUES (multi)
     )
 
     # Indeksy, które przydadzą się do analiz/filtrów
-    conn.execute(text(f"ALTER TABLE {table_name} ADD PRIMARY KEY (product_id)"))
+    add_primary_key(conn, table_name, "product_id")   # SQLite: przebudowa tabeli
     conn.execute(text(f"CREATE INDEX ix_{table_name}_category ON {table_name}(category)"))
     conn.execute(text(f"CREATE INDEX ix_{table_name}_ts ON {table_name}(ts)"))
     conn.execute(text(f"CREATE INDEX ix_{table_name}_country ON {table_name}(country)"))
+    # Złożone indeksy pokrywające dla zapytań z sekcji 4 (np. (country, ts) dla 4c)
+    create_indexes(conn, propose_indexes(conn, table_name), table_name)
 
-print(f"✓ Wstawiono {len(df):,} rekordów do tabeli `{table_name}` w bazie `{MYSQL_DB}`.")
+print(f"✓ Wstawiono {n_rows:,} rekordów do tabeli `{table_name}` w bazie `{MYSQL_DB}`.")
 
 # ------------------------
 # 4) ODCZYT I SZYBKA ANALIZA (pandas + SQL)
 # ------------------------
 # a) odczyt top 5
-with engine.connect() as conn:
+with connection(engine) as conn:
     preview = pd.read_sql(text(f"SELECT * FROM {table_name} ORDER BY product_id ASC LIMIT 5"), conn)
 print("\nPodgląd 5 pierwszych wierszy:")
 print(preview)
 
 # b) agregacja po kategorii (SQL -> pandas)
-with engine.connect() as conn:
+with connection(engine) as conn:
     agg = pd.read_sql(
         text(f"""
             SELECT category,
@@ -144,7 +124,7 @@ from datetime import datetime, timedelta
 date_from = (pd.Timestamp.utcnow() - pd.Timedelta(days=90)).to_pydatetime()
 country = "PL"
 
-with engine.connect() as conn:
+with connection(engine) as conn:
     recent_pl = pd.read_sql(
         text(f"""
             SELECT *
@@ -159,3 +139,11 @@ with engine.connect() as conn:
 
 print("\nOstatnie 10 rekordów z 90 dni dla PL:")
 print(recent_pl)
+
+# d) plany zapytań demo (EXPLAIN): indeks / filesort / pełny skan
+print("\nPlany zapytań (EXPLAIN):")
+with connection(engine) as conn:
+    report(conn, params={"date_from": date_from, "country": country})
+
+# e) metryki puli połączeń (checkouty, overflow, czas oczekiwania)
+print("\nPula połączeń:", pool_metrics(engine).snapshot())
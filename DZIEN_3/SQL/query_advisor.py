@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Doradca zapytań dla tabeli products_demo (MySQL / SQLite).
+- uruchamia EXPLAIN dla zapytań demo z products_pandas.py
+- raportuje, czy użyto indeksu, czy jest filesort i pełny skan tabeli
+- proponuje i (opcjonalnie) tworzy złożone indeksy pokrywające
+
+Uruchomienie samego sprawdzenia planów na SQLite (bez serwera MySQL):
+  python query_advisor.py
+"""
+
+from __future__ import annotations
+from datetime import datetime, timedelta
+from sqlalchemy import inspect, text
+
+TABLE_NAME = "products_demo"
+
+# ------------------------
+# 1) ZAPYTANIA DEMO (jak w products_pandas.py, sekcja 4)
+# ------------------------
+DEMO_QUERIES = {
+    "preview": f"SELECT * FROM {TABLE_NAME} ORDER BY product_id ASC LIMIT 5",
+    "agg_by_category": f"""
+        SELECT category,
+               COUNT(*) AS cnt,
+               SUM(quantity) AS total_qty,
+               ROUND(AVG(unit_price),2) AS avg_price,
+               ROUND(SUM(revenue_est),2) AS sum_revenue
+        FROM {TABLE_NAME}
+        GROUP BY category
+        ORDER BY sum_revenue DESC
+    """,
+    "recent_pl": f"""
+        SELECT *
+        FROM {TABLE_NAME}
+        WHERE ts >= :date_from AND country = :country
+        ORDER BY ts DESC
+        LIMIT 10
+    """,
+}
+
+# Proponowane indeksy złożone: nazwa -> kolumny (kolejność ma znaczenie!)
+# - (country, ts): równość po country, zakres + ORDER BY po ts -> bez filesort
+# - (category, quantity, unit_price, revenue_est): agregacja czytana z samego indeksu
+RECOMMENDED_INDEXES = {
+    f"ix_{TABLE_NAME}_country_ts": ("country", "ts"),
+    f"ix_{TABLE_NAME}_category_cover": ("category", "quantity", "unit_price", "revenue_est"),
+}
+
+
+def demo_params(days: int = 90, country: str = "PL") -> dict:
+    return {"date_from": datetime.now() - timedelta(days=days), "country": country}
+
+
+# ------------------------
+# 2) EXPLAIN + INTERPRETACJA PLANU
+# ------------------------
+def explain(conn, sql: str, params: dict | None = None) -> list[dict]:
+    """Zwraca wiersze planu jako listę słowników (EXPLAIN w MySQL, EXPLAIN QUERY PLAN w SQLite)."""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    result = conn.execute(text(prefix + sql), params or {})
+    return [dict(row._mapping) for row in result]
+
+
+def analyze_plan(plan: list[dict], dialect: str) -> dict:
+    """Sprowadza plan do trzech flag: uses_index, filesort, full_scan."""
+    if dialect == "sqlite":
+        details = [str(row["detail"]).upper() for row in plan]
+        return {
+            "uses_index": any("USING INDEX" in d or "USING COVERING INDEX" in d
+                              or "USING INTEGER PRIMARY KEY" in d for d in details),
+            "filesort": any("USE TEMP B-TREE" in d for d in details),
+            "full_scan": any(d.startswith("SCAN") and "INDEX" not in d for d in details),
+        }
+    # MySQL: kolumny key / type / Extra
+    return {
+        "uses_index": any(row.get("key") for row in plan),
+        "filesort": any("filesort" in str(row.get("Extra") or "").lower() for row in plan),
+        "full_scan": any(str(row.get("type") or "").upper() == "ALL" for row in plan),
+    }
+
+
+def existing_indexes(conn, table: str = TABLE_NAME) -> dict[str, tuple[str, ...]]:
+    return {ix["name"]: tuple(ix["column_names"]) for ix in inspect(conn).get_indexes(table)}
+
+
+def propose_indexes(conn, table: str = TABLE_NAME) -> dict[str, tuple[str, ...]]:
+    """Zwraca indeksy z RECOMMENDED_INDEXES, których prefiks kolumn nie istnieje jeszcze w tabeli."""
+    have = existing_indexes(conn, table).values()
+    return {
+        name: cols for name, cols in RECOMMENDED_INDEXES.items()
+        if not any(ix[:len(cols)] == cols for ix in have)
+    }
+
+
+def create_indexes(conn, indexes: dict[str, tuple[str, ...]], table: str = TABLE_NAME) -> None:
+    # MySQL nie ma CREATE INDEX IF NOT EXISTS - dlatego najpierw propose_indexes()
+    for name, cols in indexes.items():
+        conn.execute(text(f"CREATE INDEX {name} ON {table}({', '.join(cols)})"))
+
+
+def report(conn, params: dict | None = None, create: bool = False) -> dict[str, dict]:
+    """Wypisuje raport dla wszystkich zapytań demo; przy create=True dokłada brakujące indeksy."""
+    params = params or demo_params()
+    if create:
+        missing = propose_indexes(conn)
+        create_indexes(conn, missing)
+        for name, cols in missing.items():
+            print(f"+ utworzono indeks {name} ({', '.join(cols)})")
+
+    summary = {}
+    for name, sql in DEMO_QUERIES.items():
+        flags = analyze_plan(explain(conn, sql, params), conn.dialect.name)
+        summary[name] = flags
+        print(f"{name:<16} index={flags['uses_index']!s:<5} "
+              f"filesort={flags['filesort']!s:<5} full_scan={flags['full_scan']}")
+
+    for name, cols in propose_indexes(conn).items():
+        print(f"? propozycja: CREATE INDEX {name} ON {TABLE_NAME}({', '.join(cols)})")
+    return summary
+
+
+# ------------------------
+# 3) SPRAWDZENIE REGRESJI PLANU (SQLite, EXPLAIN QUERY PLAN)
+# ------------------------
+def check_recent_pl_plan() -> None:
+    """Na pustej kopii schematu w SQLite: bez indeksu (country, ts) jest sortowanie, z nim - nie."""
+    from sqlalchemy import create_engine
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(f"""
+            CREATE TABLE {TABLE_NAME} (
+                product_id INTEGER PRIMARY KEY, product_name TEXT, category TEXT,
+                quantity INTEGER, unit_price REAL, revenue_est REAL, ts TIMESTAMP, country TEXT)
+        """))
+        # dotychczasowe indeksy jednokolumnowe z products_pandas.py
+        for col in ("category", "ts", "country"):
+            conn.execute(text(f"CREATE INDEX ix_{TABLE_NAME}_{col} ON {TABLE_NAME}({col})"))
+
+        params = demo_params()
+        before = analyze_plan(explain(conn, DEMO_QUERIES["recent_pl"], params), "sqlite")
+        create_indexes(conn, propose_indexes(conn))
+        after = analyze_plan(explain(conn, DEMO_QUERIES["recent_pl"], params), "sqlite")
+        agg = analyze_plan(explain(conn, DEMO_QUERIES["agg_by_category"], params), "sqlite")
+
+    # jawne wyjątki zamiast assert - sprawdzenie działa też pod python -O
+    if not before["filesort"]:
+        raise RuntimeError(f"recent_pl: bez indeksu (country, ts) oczekiwano sortowania, plan {before}")
+    if not after["uses_index"] or after["filesort"]:
+        raise RuntimeError(f"recent_pl: regresja planu {after}")
+    if agg["full_scan"]:
+        raise RuntimeError(f"agg_by_category: regresja planu {agg}")
+    print(f"recent_pl przed: {before}")
+    print(f"recent_pl po:    {after}")
+    print("✓ Plany zapytań bez regresji.")
+
+
+if __name__ == "__main__":
+    check_recent_pl_plan()
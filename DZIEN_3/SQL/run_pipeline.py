@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Powtarzalny benchmark całego potoku load -> query -> analyze bez serwera MySQL.
+Uruchamia kolejno products_pandas.py i analyze_products.py na SQLite (db_backend.py)
+i wypisuje czasy etapów.
+
+  python run_pipeline.py [liczba_rekordów] [plik.sqlite]
+"""
+
+from __future__ import annotations
+import os
+import runpy
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+STAGES = ["products_pandas.py", "analyze_products.py"]
+
+
+def run_pipeline(n: int = 5000, sqlite_path: str = "benchmark.sqlite") -> dict[str, float]:
+    os.environ["DB_BACKEND"] = "sqlite"
+    os.environ["SQLITE_PATH"] = sqlite_path
+    os.environ["PRODUCTS_N"] = str(n)
+    os.environ.setdefault("MPLBACKEND", "Agg")   # plt.show() bez okna
+    Path(sqlite_path).unlink(missing_ok=True)
+    sys.path.insert(0, str(HERE))
+
+    timings = {}
+    for stage in STAGES:
+        t0 = time.perf_counter()
+        runpy.run_path(str(HERE / stage), run_name="__main__")
+        timings[stage] = time.perf_counter() - t0
+
+    print("\n--- Czasy etapów (SQLite, N = {:,}) ---".format(n))
+    for stage, seconds in timings.items():
+        print(f"{stage:<22} {seconds:8.2f} s")
+    return timings
+
+
+if __name__ == "__main__":
+    run_pipeline(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        sys.argv[2] if len(sys.argv) > 2 else "benchmark.sqlite",
+    )
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Cache read-through dla wyszukiwań użytkowników po nickname (nickname -> wiersze User).
+- LRU z limitem wpisów (OrderedDict)
+- nicki zmieniane w transakcji (after_flush: add/zmiana/usunięcie obiektów, do_orm_execute:
+  insert(User)/update(User)/delete(User) masowo) zbierane per sesja i unieważniane przy
+  after_commit i after_soft_rollback
+- sesja z niezatwierdzonymi zmianami czyta z bazy z pominięciem cache (i niczego do niego
+  nie zapisuje), więc w cache są tylko dane zatwierdzone
+
+Uwaga: Session.bulk_insert_mappings omija zdarzenia - po nim wywołaj cache.clear().
+"""
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from orm_models import User
+
+DEFAULT_MAXSIZE = 1024
+_STALE_KEY = "nickname_cache_stale"   # session.info: nicki zmienione w bieżącej transakcji
+_ALL = object()                       # UPDATE/DELETE po kryteriach - nieznane nicki
+
+
+class NicknameCache:
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, session: Session, nickname: str) -> tuple:
+        """Wiersze (id, name, fullname, nickname) dla nickname - z cache albo z bazy (i do cache)."""
+        if not _has_pending(session):
+            with self._lock:
+                rows = self._data.get(nickname)
+                if rows is not None:
+                    self._data.move_to_end(nickname)
+                    self.hits += 1
+                    return rows
+                self.misses += 1
+
+        stmt = (select(User.id, User.name, User.fullname, User.nickname)
+                .where(User.nickname == nickname)
+                .order_by(User.id))
+        rows = tuple(session.execute(stmt).all())
+        if _has_pending(session):
+            return rows   # widok niezatwierdzonej transakcji (po autoflush) - nie do cache
+        with self._lock:
+            self._data[nickname] = rows
+            self._data.move_to_end(nickname)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)   # najdawniej używany
+        return rows
+
+    def invalidate(self, *nicknames) -> None:
+        with self._lock:
+            for nickname in nicknames:
+                self._data.pop(nickname, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # ------------------------
+    # unieważnianie przez zdarzenia sesji
+    # ------------------------
+    def install(self, target=Session) -> "NicknameCache":
+        """Podpina nasłuch zdarzeń pod klasę Session, sessionmaker albo konkretną sesję."""
+        event.listen(target, "after_flush", self._after_flush)
+        event.listen(target, "do_orm_execute", self._on_orm_execute)
+        event.listen(target, "after_commit", self._after_commit)
+        event.listen(target, "after_soft_rollback", self._after_soft_rollback)
+        return self
+
+    def _invalidate_stale(self, stale: set) -> None:
+        if _ALL in stale:
+            self.clear()
+        else:
+            self.invalidate(*stale)
+
+    def _after_commit(self, session) -> None:
+        self._invalidate_stale(session.info.pop(_STALE_KEY, set()))
+
+    def _after_soft_rollback(self, session, previous_transaction) -> None:
+        stale = session.info.get(_STALE_KEY, set())
+        self._invalidate_stale(stale)
+        if not session.in_transaction():
+            session.info.pop(_STALE_KEY, None)   # cała transakcja wycofana
+
+    def _after_flush(self, session, flush_context) -> None:
+        stale = set()
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if not isinstance(obj, User):
+                continue
+            history = inspect(obj).attrs.nickname.history
+            stale.update(history.added or ())
+            stale.update(history.deleted or ())
+            stale.update(history.unchanged or ())
+        _stale(session).update(stale)
+
+    def _on_orm_execute(self, state) -> None:
+        if not (state.is_insert or state.is_update or state.is_delete):
+            return
+        mapper = state.bind_mapper
+        if mapper is None or mapper.class_ is not User:
+            return
+        params = state.parameters
+        if state.is_insert and params:
+            rows = params if isinstance(params, list) else [params]
+            _stale(state.session).update(row.get("nickname") for row in rows)
+        else:
+            # UPDATE/DELETE po kryteriach - nie wiemy, których nicków dotyczą
+            _stale(state.session).add(_ALL)
+
+
+def _stale(session: Session) -> set:
+    return session.info.setdefault(_STALE_KEY, set())
+
+
+def _has_pending(session: Session) -> bool:
+    """Czy sesja ma zmiany niewidoczne dla innych: wysłane (flush) albo czekające na flush."""
+    return bool(session.info.get(_STALE_KEY) or session.new or session.dirty or session.deleted)
+
+
+nickname_cache = NicknameCache()
+
+
+def users_by_nickname(session: Session, nickname: str) -> tuple:
+    return nickname_cache.get(session, nickname)